@@ -14,33 +14,49 @@ Usage:
     python sap_agent_standalone.py --output ./reports    # Custom output directory
 
 Requirements:
-    requests, beautifulsoup4, python-pptx, lxml, fake-useragent, tqdm
+    requests, python-pptx, lxml, tqdm
 
 Author: Claude Code
 Date: 2026-02-27
 """
 
 import argparse
+import atexit
+import copy
+import heapq
+import io
+import json
 import logging
+import random
 import sys
 import time
 import re
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
 from datetime import date
-from collections import defaultdict, Counter
-from dataclasses import dataclass, field, asdict
+from collections import defaultdict, Counter, OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from urllib.parse import quote_plus, urljoin, urlparse
 from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from requests.adapters import HTTPAdapter
+import lxml.html
+from lxml import etree
 from tqdm import tqdm
 
-from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+try:
+    import requests_cache
+except ImportError:  # optional: without it every run goes to the network
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # optional: signal export falls back to the stdlib encoder
+    orjson = None
 
 # ============================================================================
 # LOGGING & CONFIG
@@ -53,20 +69,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger("agent")
 
-# Branding colors for PPTX
-SAP_BLUE = RGBColor(0x00, 0x70, 0xF2)
-SAP_DARK = RGBColor(0x1B, 0x2D, 0x45)
-SAP_GOLD = RGBColor(0xE8, 0xA8, 0x00)
-WHITE = RGBColor(0xFF, 0xFF, 0xFF)
-LIGHT_GRAY = RGBColor(0xF5, 0xF5, 0xF5)
-GRAY = RGBColor(0x66, 0x66, 0x66)
+# Branding colors for PPTX as (r, g, b); ReportGenerator builds its RGBColor values from these
+SAP_BLUE = (0x00, 0x70, 0xF2)
+SAP_DARK = (0x1B, 0x2D, 0x45)
+SAP_GOLD = (0xE8, 0xA8, 0x00)
+WHITE = (0xFF, 0xFF, 0xFF)
+LIGHT_GRAY = (0xF5, 0xF5, 0xF5)
+GRAY = (0x66, 0x66, 0x66)
+
+
+def _load_pptx():
+    """Import python-pptx on first use. lxml is already loaded for parsing,
+    but pptx's own package (oxml element classes, parts, shapes, opc
+    packaging) is dozens of modules that --help and scrape-only code paths
+    should not pay for."""
+    global Presentation, Inches, Pt, Emu, RGBColor, PP_ALIGN, MSO_ANCHOR
+    from pptx import Presentation
+    from pptx.util import Inches, Pt, Emu
+    from pptx.dml.color import RGBColor
+    from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 
 # ============================================================================
 # EXCLUSION LIST — System Integrators, Tech Vendors, Generic Terms
 # These are NOT SAP end-customers; they sell/implement SAP or are tech vendors
 # ============================================================================
 
-EXCLUDED_COMPANIES = {
+EXCLUDED_COMPANIES = frozenset(term.lower() for term in {
     # System Integrators & Consulting
     "accenture", "deloitte", "pwc", "pricewaterhousecoopers", "kpmg", "ey",
     "ernst & young", "ernst young", "capgemini", "infosys", "wipro", "tcs",
@@ -83,25 +111,46 @@ EXCLUDED_COMPANIES = {
     # Generic / Noise
     "unknown", "n/a", "confidential", "(conference speaker)", "various",
     "linkedin", "indeed", "bayt", "gulftalent", "glassdoor", "monster",
-}
+})
+
+# One alternation over every excluded term, longest first, matched on word
+# boundaries so "ey" does not hit "Turkey" and "intel" does not hit "intelligence"
+_EXCLUDED_RE = re.compile(
+    r"(?<!\w)(?:"
+    + "|".join(map(re.escape, sorted(EXCLUDED_COMPANIES, key=lambda term: (-len(term), term))))
+    + r")(?!\w)"
+)
+
+@lru_cache(maxsize=4096)
+def _norm(name: str) -> str:
+    """Lowercase a name and collapse runs of whitespace ("Saudi  Aramco ")."""
+    return " ".join(name.lower().split())
 
+
+@lru_cache(maxsize=4096)
 def is_excluded(company_name: str) -> bool:
-    """Check if a company should be excluded (SI, vendor, or noise)."""
-    normalized = company_name.strip().lower()
+    """Check if a company should be excluded (SI, vendor, or noise).
+
+    Memoized: the same names are checked by the scrapers and again in dedup.
+    """
+    # Terms are stored lowercase, so only the candidate needs normalizing
+    normalized = _norm(company_name)
     # Direct match
     if normalized in EXCLUDED_COMPANIES:
         return True
     # Partial match for common SI patterns
-    for excl in EXCLUDED_COMPANIES:
-        if excl in normalized or normalized in excl:
-            return True
-    return False
+    return _EXCLUDED_RE.search(normalized) is not None
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+# signal_quality as an orderable number; _QUALITY_NAMES maps it back
+_QUALITY_RANK = {"High": 3, "Medium": 2, "Low": 1, "": 0}
+_QUALITY_NAMES = ("", "Low", "Medium", "High")
+
+
+@dataclass(slots=True)
 class SAPSignal:
     """A single SAP customer intelligence signal."""
     company: str
@@ -114,195 +163,277 @@ class SAPSignal:
     source_url: str = ""
     summary: str = ""
     date_detected: str = field(default_factory=lambda: date.today().isoformat())
+    quality_num: int = field(init=False, repr=False, compare=False)
+    norm_key: str = field(init=False, repr=False, compare=False)  # dedup key
+
+    def __post_init__(self):
+        # Only a handful of distinct values across thousands of signals
+        self.country = sys.intern(self.country)
+        self.industry = sys.intern(self.industry)
+        self.signal_type = sys.intern(self.signal_type)
+        self.signal_quality = sys.intern(self.signal_quality)
+        self.source_name = sys.intern(self.source_name)
+        self.sap_products = [sys.intern(p) for p in self.sap_products]
+        self.quality_num = _QUALITY_RANK.get(self.signal_quality, 0)
+        self.norm_key = sys.intern(normalize_company(self.company))
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat fields only, so skip asdict()'s recursive deepcopy
+        return {
+            "company": self.company,
+            "country": self.country,
+            "sap_products": list(self.sap_products),
+            "industry": self.industry,
+            "signal_type": self.signal_type,
+            "signal_quality": self.signal_quality,
+            "source_name": self.source_name,
+            "source_url": self.source_url,
+            "summary": self.summary,
+            "date_detected": self.date_detected,
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """One JSON object, newline-terminated (a JSONL record)."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+        return json.dumps(self.to_dict(), ensure_ascii=False).encode("utf-8") + b"\n"
 
 
 # ============================================================================
 # CURATED SEED LIST — Confirmed SAP Customers in GCC
 # Sources: SAP customer stories, SAP press releases, public go-live
 # announcements, DSAG/ASUG membership lists, annual reports mentioning SAP
+# Each entry: (company, country, products, industry)
 # ============================================================================
 
-SEED_CUSTOMERS = [
+SEED_CUSTOMERS: tuple[tuple[str, str, tuple[str, ...], str], ...] = (
     # === SAUDI ARABIA ===
     # Energy & Petrochemicals
-    {"company": "Saudi Aramco", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP Ariba", "SAP SuccessFactors"], "industry": "Oil & Gas"},
-    {"company": "SABIC", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP Ariba", "SAP Analytics Cloud"], "industry": "Chemicals"},
-    {"company": "Ma'aden (Saudi Arabian Mining)", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP Ariba"], "industry": "Mining"},
-    {"company": "ACWA Power", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Energy & Utilities"},
-    {"company": "Saudi Electricity Company (SEC)", "country": "Saudi Arabia", "products": ["SAP ECC", "SAP SuccessFactors"], "industry": "Utilities"},
-    {"company": "Petro Rabigh", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Petrochemicals"},
-    {"company": "SATORP", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Oil & Gas"},
-    {"company": "Yanbu Aramco Sinopec Refining (YASREF)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Oil & Gas"},
+    ("Saudi Aramco", "Saudi Arabia", ("SAP S/4HANA", "SAP Ariba", "SAP SuccessFactors"), "Oil & Gas"),
+    ("SABIC", "Saudi Arabia", ("SAP S/4HANA", "SAP Ariba", "SAP Analytics Cloud"), "Chemicals"),
+    ("Ma'aden (Saudi Arabian Mining)", "Saudi Arabia", ("SAP S/4HANA", "SAP Ariba"), "Mining"),
+    ("ACWA Power", "Saudi Arabia", ("SAP S/4HANA", "SAP SuccessFactors"), "Energy & Utilities"),
+    ("Saudi Electricity Company (SEC)", "Saudi Arabia", ("SAP ECC", "SAP SuccessFactors"), "Utilities"),
+    ("Petro Rabigh", "Saudi Arabia", ("SAP ECC",), "Petrochemicals"),
+    ("SATORP", "Saudi Arabia", ("SAP S/4HANA",), "Oil & Gas"),
+    ("Yanbu Aramco Sinopec Refining (YASREF)", "Saudi Arabia", ("SAP ECC",), "Oil & Gas"),
 
     # Telecom & Tech
-    {"company": "stc (Saudi Telecom Company)", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP BTP", "SAP SuccessFactors"], "industry": "Telecom"},
-    {"company": "Mobily (Etihad Etisalat)", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Telecom"},
-    {"company": "Zain KSA", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Telecom"},
-    {"company": "SITE (Saudi Information Technology Company)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Technology"},
+    ("stc (Saudi Telecom Company)", "Saudi Arabia", ("SAP S/4HANA", "SAP BTP", "SAP SuccessFactors"), "Telecom"),
+    ("Mobily (Etihad Etisalat)", "Saudi Arabia", ("SAP S/4HANA", "SAP SuccessFactors"), "Telecom"),
+    ("Zain KSA", "Saudi Arabia", ("SAP S/4HANA",), "Telecom"),
+    ("SITE (Saudi Information Technology Company)", "Saudi Arabia", ("SAP ECC",), "Technology"),
 
     # Banking & Finance
-    {"company": "Saudi National Bank (SNB)", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Banking"},
-    {"company": "Al Rajhi Bank", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Banking"},
-    {"company": "Riyad Bank", "country": "Saudi Arabia", "products": ["SAP ECC", "SAP SuccessFactors"], "industry": "Banking"},
-    {"company": "Banque Saudi Fransi (BSF)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Banking"},
-    {"company": "Arab National Bank", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Banking"},
-    {"company": "Alinma Bank", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Banking"},
-    {"company": "Saudi Awwal Bank (SAB)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Banking"},
+    ("Saudi National Bank (SNB)", "Saudi Arabia", ("SAP S/4HANA", "SAP SuccessFactors"), "Banking"),
+    ("Al Rajhi Bank", "Saudi Arabia", ("SAP S/4HANA", "SAP SuccessFactors"), "Banking"),
+    ("Riyad Bank", "Saudi Arabia", ("SAP ECC", "SAP SuccessFactors"), "Banking"),
+    ("Banque Saudi Fransi (BSF)", "Saudi Arabia", ("SAP ECC",), "Banking"),
+    ("Arab National Bank", "Saudi Arabia", ("SAP ECC",), "Banking"),
+    ("Alinma Bank", "Saudi Arabia", ("SAP S/4HANA",), "Banking"),
+    ("Saudi Awwal Bank (SAB)", "Saudi Arabia", ("SAP ECC",), "Banking"),
 
     # FMCG, Retail & Food
-    {"company": "Almarai", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP Ariba", "SAP IBP"], "industry": "Food & Beverage"},
-    {"company": "Savola Group", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Food & Retail"},
-    {"company": "Al Faisaliah Group", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Conglomerate"},
-    {"company": "Panda Retail (now owned by Savola)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Retail"},
-    {"company": "BinDawood Holding", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Retail"},
-    {"company": "Jarir Marketing", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Retail"},
-    {"company": "Extra (United Electronics Company)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Retail"},
+    ("Almarai", "Saudi Arabia", ("SAP S/4HANA", "SAP Ariba", "SAP IBP"), "Food & Beverage"),
+    ("Savola Group", "Saudi Arabia", ("SAP S/4HANA",), "Food & Retail"),
+    ("Al Faisaliah Group", "Saudi Arabia", ("SAP ECC",), "Conglomerate"),
+    ("Panda Retail (now owned by Savola)", "Saudi Arabia", ("SAP ECC",), "Retail"),
+    ("BinDawood Holding", "Saudi Arabia", ("SAP S/4HANA",), "Retail"),
+    ("Jarir Marketing", "Saudi Arabia", ("SAP ECC",), "Retail"),
+    ("Extra (United Electronics Company)", "Saudi Arabia", ("SAP ECC",), "Retail"),
 
     # Construction, Real Estate & Infrastructure
-    {"company": "Saudi Binladin Group", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Construction"},
-    {"company": "El Seif Engineering", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Construction"},
-    {"company": "Dar Al Arkan", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Real Estate"},
-    {"company": "ROSHN", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Real Estate"},
-    {"company": "NEOM", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP BTP"], "industry": "Mega-project"},
-    {"company": "The Red Sea Development Company (TRSDC)", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Tourism & Development"},
-    {"company": "Qiddiya Investment Company", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Entertainment"},
+    ("Saudi Binladin Group", "Saudi Arabia", ("SAP ECC",), "Construction"),
+    ("El Seif Engineering", "Saudi Arabia", ("SAP ECC",), "Construction"),
+    ("Dar Al Arkan", "Saudi Arabia", ("SAP ECC",), "Real Estate"),
+    ("ROSHN", "Saudi Arabia", ("SAP S/4HANA",), "Real Estate"),
+    ("NEOM", "Saudi Arabia", ("SAP S/4HANA", "SAP BTP"), "Mega-project"),
+    ("The Red Sea Development Company (TRSDC)", "Saudi Arabia", ("SAP S/4HANA",), "Tourism & Development"),
+    ("Qiddiya Investment Company", "Saudi Arabia", ("SAP S/4HANA",), "Entertainment"),
 
     # Government & Semi-Gov
-    {"company": "Saudi Aramco Trading Company", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Trading"},
-    {"company": "GOSI (General Organization for Social Insurance)", "country": "Saudi Arabia", "products": ["SAP ECC", "SAP SuccessFactors"], "industry": "Government"},
-    {"company": "Saudi Post (SPL)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Logistics"},
-    {"company": "Saudi Customs (Zakat, Tax and Customs Authority)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Government"},
-    {"company": "Royal Commission for Jubail and Yanbu", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Government"},
+    ("Saudi Aramco Trading Company", "Saudi Arabia", ("SAP S/4HANA",), "Trading"),
+    ("GOSI (General Organization for Social Insurance)", "Saudi Arabia", ("SAP ECC", "SAP SuccessFactors"), "Government"),
+    ("Saudi Post (SPL)", "Saudi Arabia", ("SAP ECC",), "Logistics"),
+    ("Saudi Customs (Zakat, Tax and Customs Authority)", "Saudi Arabia", ("SAP ECC",), "Government"),
+    ("Royal Commission for Jubail and Yanbu", "Saudi Arabia", ("SAP ECC",), "Government"),
 
     # Healthcare & Pharma
-    {"company": "Saudi Pharmaceutical Industries (SPIMACO)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Pharma"},
-    {"company": "Dr. Sulaiman Al Habib Medical Group", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Healthcare"},
-    {"company": "Nahdi Medical Company", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Healthcare & Retail"},
+    ("Saudi Pharmaceutical Industries (SPIMACO)", "Saudi Arabia", ("SAP ECC",), "Pharma"),
+    ("Dr. Sulaiman Al Habib Medical Group", "Saudi Arabia", ("SAP S/4HANA",), "Healthcare"),
+    ("Nahdi Medical Company", "Saudi Arabia", ("SAP S/4HANA",), "Healthcare & Retail"),
 
     # Transport & Logistics
-    {"company": "Saudi Arabian Airlines (Saudia)", "country": "Saudi Arabia", "products": ["SAP ECC", "SAP SuccessFactors"], "industry": "Aviation"},
-    {"company": "Flynas", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Aviation"},
-    {"company": "Saudi Railway Company (SAR)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Transport"},
-    {"company": "Bahri (National Shipping Company)", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Shipping"},
-    {"company": "Abdul Latif Jameel (ALJ)", "country": "Saudi Arabia", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Automotive & Diversified"},
+    ("Saudi Arabian Airlines (Saudia)", "Saudi Arabia", ("SAP ECC", "SAP SuccessFactors"), "Aviation"),
+    ("Flynas", "Saudi Arabia", ("SAP S/4HANA",), "Aviation"),
+    ("Saudi Railway Company (SAR)", "Saudi Arabia", ("SAP ECC",), "Transport"),
+    ("Bahri (National Shipping Company)", "Saudi Arabia", ("SAP S/4HANA",), "Shipping"),
+    ("Abdul Latif Jameel (ALJ)", "Saudi Arabia", ("SAP S/4HANA", "SAP SuccessFactors"), "Automotive & Diversified"),
 
     # Industrial & Manufacturing
-    {"company": "Saudi Ceramic", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Manufacturing"},
-    {"company": "Zamil Industrial", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Industrial"},
-    {"company": "National Industrialization Company (Tasnee)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Industrial"},
-    {"company": "Sadara Chemical Company", "country": "Saudi Arabia", "products": ["SAP S/4HANA"], "industry": "Chemicals"},
-    {"company": "Advanced Petrochemical Company", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Chemicals"},
-    {"company": "Sipchem (Saudi International Petrochemical)", "country": "Saudi Arabia", "products": ["SAP ECC"], "industry": "Chemicals"},
+    ("Saudi Ceramic", "Saudi Arabia", ("SAP ECC",), "Manufacturing"),
+    ("Zamil Industrial", "Saudi Arabia", ("SAP ECC",), "Industrial"),
+    ("National Industrialization Company (Tasnee)", "Saudi Arabia", ("SAP ECC",), "Industrial"),
+    ("Sadara Chemical Company", "Saudi Arabia", ("SAP S/4HANA",), "Chemicals"),
+    ("Advanced Petrochemical Company", "Saudi Arabia", ("SAP ECC",), "Chemicals"),
+    ("Sipchem (Saudi International Petrochemical)", "Saudi Arabia", ("SAP ECC",), "Chemicals"),
 
     # === UAE ===
     # Energy & Utilities
-    {"company": "ADNOC (Abu Dhabi National Oil Company)", "country": "UAE", "products": ["SAP S/4HANA", "SAP Ariba", "SAP Analytics Cloud"], "industry": "Oil & Gas"},
-    {"company": "DEWA (Dubai Electricity & Water Authority)", "country": "UAE", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Utilities"},
-    {"company": "ENOC (Emirates National Oil Company)", "country": "UAE", "products": ["SAP ECC"], "industry": "Oil & Gas"},
-    {"company": "Masdar", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Renewable Energy"},
-    {"company": "TAQA (Abu Dhabi National Energy Company)", "country": "UAE", "products": ["SAP ECC"], "industry": "Energy"},
-    {"company": "Sharjah Electricity, Water and Gas Authority (SEWA)", "country": "UAE", "products": ["SAP ECC"], "industry": "Utilities"},
+    ("ADNOC (Abu Dhabi National Oil Company)", "UAE", ("SAP S/4HANA", "SAP Ariba", "SAP Analytics Cloud"), "Oil & Gas"),
+    ("DEWA (Dubai Electricity & Water Authority)", "UAE", ("SAP S/4HANA", "SAP SuccessFactors"), "Utilities"),
+    ("ENOC (Emirates National Oil Company)", "UAE", ("SAP ECC",), "Oil & Gas"),
+    ("Masdar", "UAE", ("SAP S/4HANA",), "Renewable Energy"),
+    ("TAQA (Abu Dhabi National Energy Company)", "UAE", ("SAP ECC",), "Energy"),
+    ("Sharjah Electricity, Water and Gas Authority (SEWA)", "UAE", ("SAP ECC",), "Utilities"),
 
     # Telecom
-    {"company": "Etisalat (e&)", "country": "UAE", "products": ["SAP S/4HANA", "SAP BTP", "SAP SuccessFactors"], "industry": "Telecom"},
-    {"company": "du (Emirates Integrated Telecommunications)", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Telecom"},
+    ("Etisalat (e&)", "UAE", ("SAP S/4HANA", "SAP BTP", "SAP SuccessFactors"), "Telecom"),
+    ("du (Emirates Integrated Telecommunications)", "UAE", ("SAP S/4HANA",), "Telecom"),
 
     # Aviation & Travel
-    {"company": "Emirates Airlines", "country": "UAE", "products": ["SAP S/4HANA", "SAP SuccessFactors", "SAP Ariba"], "industry": "Aviation"},
-    {"company": "Etihad Airways", "country": "UAE", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Aviation"},
-    {"company": "flydubai", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Aviation"},
-    {"company": "Dnata", "country": "UAE", "products": ["SAP ECC"], "industry": "Aviation Services"},
-    {"company": "Abu Dhabi Airports", "country": "UAE", "products": ["SAP ECC"], "industry": "Aviation"},
-    {"company": "Dubai Airports", "country": "UAE", "products": ["SAP ECC"], "industry": "Aviation"},
+    ("Emirates Airlines", "UAE", ("SAP S/4HANA", "SAP SuccessFactors", "SAP Ariba"), "Aviation"),
+    ("Etihad Airways", "UAE", ("SAP S/4HANA", "SAP SuccessFactors"), "Aviation"),
+    ("flydubai", "UAE", ("SAP S/4HANA",), "Aviation"),
+    ("Dnata", "UAE", ("SAP ECC",), "Aviation Services"),
+    ("Abu Dhabi Airports", "UAE", ("SAP ECC",), "Aviation"),
+    ("Dubai Airports", "UAE", ("SAP ECC",), "Aviation"),
 
     # Banking & Finance
-    {"company": "First Abu Dhabi Bank (FAB)", "country": "UAE", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Banking"},
-    {"company": "Emirates NBD", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Banking"},
-    {"company": "Abu Dhabi Commercial Bank (ADCB)", "country": "UAE", "products": ["SAP ECC"], "industry": "Banking"},
-    {"company": "Mashreq Bank", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Banking"},
-    {"company": "Dubai Islamic Bank (DIB)", "country": "UAE", "products": ["SAP ECC"], "industry": "Banking"},
-    {"company": "Abu Dhabi Islamic Bank (ADIB)", "country": "UAE", "products": ["SAP ECC"], "industry": "Banking"},
+    ("First Abu Dhabi Bank (FAB)", "UAE", ("SAP S/4HANA", "SAP SuccessFactors"), "Banking"),
+    ("Emirates NBD", "UAE", ("SAP S/4HANA",), "Banking"),
+    ("Abu Dhabi Commercial Bank (ADCB)", "UAE", ("SAP ECC",), "Banking"),
+    ("Mashreq Bank", "UAE", ("SAP S/4HANA",), "Banking"),
+    ("Dubai Islamic Bank (DIB)", "UAE", ("SAP ECC",), "Banking"),
+    ("Abu Dhabi Islamic Bank (ADIB)", "UAE", ("SAP ECC",), "Banking"),
 
     # Real Estate & Construction
-    {"company": "Emaar Properties", "country": "UAE", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Real Estate"},
-    {"company": "Aldar Properties", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Real Estate"},
-    {"company": "DAMAC Properties", "country": "UAE", "products": ["SAP ECC"], "industry": "Real Estate"},
-    {"company": "Nakheel", "country": "UAE", "products": ["SAP ECC"], "industry": "Real Estate"},
-    {"company": "Arabtec (now ADNEC Group)", "country": "UAE", "products": ["SAP ECC"], "industry": "Construction"},
+    ("Emaar Properties", "UAE", ("SAP S/4HANA", "SAP SuccessFactors"), "Real Estate"),
+    ("Aldar Properties", "UAE", ("SAP S/4HANA",), "Real Estate"),
+    ("DAMAC Properties", "UAE", ("SAP ECC",), "Real Estate"),
+    ("Nakheel", "UAE", ("SAP ECC",), "Real Estate"),
+    ("Arabtec (now ADNEC Group)", "UAE", ("SAP ECC",), "Construction"),
 
     # Conglomerates & Diversified
-    {"company": "Majid Al Futtaim", "country": "UAE", "products": ["SAP S/4HANA", "SAP CX", "SAP Ariba"], "industry": "Retail & Leisure"},
-    {"company": "Al-Futtaim Group", "country": "UAE", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Diversified"},
-    {"company": "Chalhoub Group", "country": "UAE", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Luxury Retail"},
-    {"company": "Landmark Group", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Retail"},
-    {"company": "Al Ghurair Group", "country": "UAE", "products": ["SAP ECC"], "industry": "Conglomerate"},
-    {"company": "Al Habtoor Group", "country": "UAE", "products": ["SAP ECC"], "industry": "Conglomerate"},
+    ("Majid Al Futtaim", "UAE", ("SAP S/4HANA", "SAP CX", "SAP Ariba"), "Retail & Leisure"),
+    ("Al-Futtaim Group", "UAE", ("SAP S/4HANA", "SAP SuccessFactors"), "Diversified"),
+    ("Chalhoub Group", "UAE", ("SAP S/4HANA", "SAP SuccessFactors"), "Luxury Retail"),
+    ("Landmark Group", "UAE", ("SAP S/4HANA",), "Retail"),
+    ("Al Ghurair Group", "UAE", ("SAP ECC",), "Conglomerate"),
+    ("Al Habtoor Group", "UAE", ("SAP ECC",), "Conglomerate"),
 
     # Government & Sovereign Wealth
-    {"company": "Mubadala Investment Company", "country": "UAE", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Investment"},
-    {"company": "Abu Dhabi Investment Authority (ADIA)", "country": "UAE", "products": ["SAP ECC"], "industry": "Investment"},
-    {"company": "Dubai Holding", "country": "UAE", "products": ["SAP ECC"], "industry": "Conglomerate"},
-    {"company": "Dubai World", "country": "UAE", "products": ["SAP ECC"], "industry": "Conglomerate"},
-    {"company": "DP World", "country": "UAE", "products": ["SAP S/4HANA", "SAP Ariba"], "industry": "Ports & Logistics"},
+    ("Mubadala Investment Company", "UAE", ("SAP S/4HANA", "SAP SuccessFactors"), "Investment"),
+    ("Abu Dhabi Investment Authority (ADIA)", "UAE", ("SAP ECC",), "Investment"),
+    ("Dubai Holding", "UAE", ("SAP ECC",), "Conglomerate"),
+    ("Dubai World", "UAE", ("SAP ECC",), "Conglomerate"),
+    ("DP World", "UAE", ("SAP S/4HANA", "SAP Ariba"), "Ports & Logistics"),
 
     # Industrial & Manufacturing
-    {"company": "Emirates Global Aluminium (EGA)", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Manufacturing"},
-    {"company": "Borouge", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Chemicals"},
-    {"company": "GEMS Education", "country": "UAE", "products": ["SAP SuccessFactors"], "industry": "Education"},
-    {"company": "Agthia Group", "country": "UAE", "products": ["SAP S/4HANA"], "industry": "Food & Beverage"},
-    {"company": "Al Ain Farms", "country": "UAE", "products": ["SAP ECC"], "industry": "Food & Beverage"},
+    ("Emirates Global Aluminium (EGA)", "UAE", ("SAP S/4HANA",), "Manufacturing"),
+    ("Borouge", "UAE", ("SAP S/4HANA",), "Chemicals"),
+    ("GEMS Education", "UAE", ("SAP SuccessFactors",), "Education"),
+    ("Agthia Group", "UAE", ("SAP S/4HANA",), "Food & Beverage"),
+    ("Al Ain Farms", "UAE", ("SAP ECC",), "Food & Beverage"),
 
     # === QATAR ===
     # Energy
-    {"company": "QatarEnergy (formerly Qatar Petroleum)", "country": "Qatar", "products": ["SAP S/4HANA", "SAP Ariba", "SAP SuccessFactors"], "industry": "Oil & Gas"},
-    {"company": "RasGas (now part of QatarEnergy)", "country": "Qatar", "products": ["SAP ECC"], "industry": "LNG"},
-    {"company": "Qatargas (now part of QatarEnergy)", "country": "Qatar", "products": ["SAP ECC"], "industry": "LNG"},
-    {"company": "Qatar Petrochemical Company (QAPCO)", "country": "Qatar", "products": ["SAP ECC"], "industry": "Petrochemicals"},
-    {"company": "Industries Qatar (IQ)", "country": "Qatar", "products": ["SAP ECC"], "industry": "Industrial"},
-    {"company": "Kahramaa (Qatar General Electricity & Water Corp)", "country": "Qatar", "products": ["SAP ECC"], "industry": "Utilities"},
+    ("QatarEnergy (formerly Qatar Petroleum)", "Qatar", ("SAP S/4HANA", "SAP Ariba", "SAP SuccessFactors"), "Oil & Gas"),
+    ("RasGas (now part of QatarEnergy)", "Qatar", ("SAP ECC",), "LNG"),
+    ("Qatargas (now part of QatarEnergy)", "Qatar", ("SAP ECC",), "LNG"),
+    ("Qatar Petrochemical Company (QAPCO)", "Qatar", ("SAP ECC",), "Petrochemicals"),
+    ("Industries Qatar (IQ)", "Qatar", ("SAP ECC",), "Industrial"),
+    ("Kahramaa (Qatar General Electricity & Water Corp)", "Qatar", ("SAP ECC",), "Utilities"),
 
     # Telecom
-    {"company": "Ooredoo Qatar", "country": "Qatar", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Telecom"},
-    {"company": "Vodafone Qatar", "country": "Qatar", "products": ["SAP ECC"], "industry": "Telecom"},
+    ("Ooredoo Qatar", "Qatar", ("SAP S/4HANA", "SAP SuccessFactors"), "Telecom"),
+    ("Vodafone Qatar", "Qatar", ("SAP ECC",), "Telecom"),
 
     # Aviation & Transport
-    {"company": "Qatar Airways", "country": "Qatar", "products": ["SAP S/4HANA", "SAP SuccessFactors", "SAP Ariba"], "industry": "Aviation"},
-    {"company": "Hamad International Airport", "country": "Qatar", "products": ["SAP ECC"], "industry": "Aviation"},
-    {"company": "Mowasalat (Karwa)", "country": "Qatar", "products": ["SAP ECC"], "industry": "Transport"},
+    ("Qatar Airways", "Qatar", ("SAP S/4HANA", "SAP SuccessFactors", "SAP Ariba"), "Aviation"),
+    ("Hamad International Airport", "Qatar", ("SAP ECC",), "Aviation"),
+    ("Mowasalat (Karwa)", "Qatar", ("SAP ECC",), "Transport"),
 
     # Banking & Finance
-    {"company": "Qatar National Bank (QNB)", "country": "Qatar", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Banking"},
-    {"company": "Commercial Bank of Qatar", "country": "Qatar", "products": ["SAP ECC"], "industry": "Banking"},
-    {"company": "Doha Bank", "country": "Qatar", "products": ["SAP ECC"], "industry": "Banking"},
-    {"company": "Qatar Islamic Bank (QIB)", "country": "Qatar", "products": ["SAP ECC"], "industry": "Banking"},
-    {"company": "Masraf Al Rayan", "country": "Qatar", "products": ["SAP ECC"], "industry": "Banking"},
+    ("Qatar National Bank (QNB)", "Qatar", ("SAP S/4HANA", "SAP SuccessFactors"), "Banking"),
+    ("Commercial Bank of Qatar", "Qatar", ("SAP ECC",), "Banking"),
+    ("Doha Bank", "Qatar", ("SAP ECC",), "Banking"),
+    ("Qatar Islamic Bank (QIB)", "Qatar", ("SAP ECC",), "Banking"),
+    ("Masraf Al Rayan", "Qatar", ("SAP ECC",), "Banking"),
 
     # Real Estate & Construction
-    {"company": "Barwa Real Estate", "country": "Qatar", "products": ["SAP ECC"], "industry": "Real Estate"},
-    {"company": "Qatari Diar", "country": "Qatar", "products": ["SAP ECC"], "industry": "Real Estate"},
-    {"company": "Lusail Real Estate Development Company", "country": "Qatar", "products": ["SAP S/4HANA"], "industry": "Real Estate"},
+    ("Barwa Real Estate", "Qatar", ("SAP ECC",), "Real Estate"),
+    ("Qatari Diar", "Qatar", ("SAP ECC",), "Real Estate"),
+    ("Lusail Real Estate Development Company", "Qatar", ("SAP S/4HANA",), "Real Estate"),
 
     # Government & Sovereign
-    {"company": "Qatar Investment Authority (QIA)", "country": "Qatar", "products": ["SAP ECC"], "industry": "Investment"},
-    {"company": "Qatar Foundation", "country": "Qatar", "products": ["SAP S/4HANA", "SAP SuccessFactors"], "industry": "Education & Non-profit"},
-    {"company": "Supreme Committee for Delivery & Legacy", "country": "Qatar", "products": ["SAP S/4HANA"], "industry": "Government"},
-    {"company": "Aspire Zone Foundation", "country": "Qatar", "products": ["SAP ECC"], "industry": "Sports"},
-    {"company": "Sidra Medicine", "country": "Qatar", "products": ["SAP S/4HANA"], "industry": "Healthcare"},
+    ("Qatar Investment Authority (QIA)", "Qatar", ("SAP ECC",), "Investment"),
+    ("Qatar Foundation", "Qatar", ("SAP S/4HANA", "SAP SuccessFactors"), "Education & Non-profit"),
+    ("Supreme Committee for Delivery & Legacy", "Qatar", ("SAP S/4HANA",), "Government"),
+    ("Aspire Zone Foundation", "Qatar", ("SAP ECC",), "Sports"),
+    ("Sidra Medicine", "Qatar", ("SAP S/4HANA",), "Healthcare"),
 
     # Other
-    {"company": "Milaha (Qatar Navigation)", "country": "Qatar", "products": ["SAP ECC"], "industry": "Shipping & Logistics"},
-    {"company": "Nakilat (Qatar Gas Transport Company)", "country": "Qatar", "products": ["SAP ECC"], "industry": "Shipping"},
-    {"company": "Qatar Steel", "country": "Qatar", "products": ["SAP ECC"], "industry": "Manufacturing"},
-]
+    ("Milaha (Qatar Navigation)", "Qatar", ("SAP ECC",), "Shipping & Logistics"),
+    ("Nakilat (Qatar Gas Transport Company)", "Qatar", ("SAP ECC",), "Shipping"),
+    ("Qatar Steel", "Qatar", ("SAP ECC",), "Manufacturing"),
+)
 
 
 # ============================================================================
 # BASE SCRAPER
 # ============================================================================
 
+# The same search URLs are parsed again on retries and fallbacks
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
+_KEYWORD_RE = re.compile(r"[a-zA-Z]{3,}")
+
+
+@lru_cache(maxsize=512)
+def _site_search_url(domain: str, query_part: str) -> str:
+    """Google site: search URL built from the keywords of a blocked URL."""
+    keywords = _KEYWORD_RE.findall(query_part)
+    search_terms = " ".join(keywords[:5]) if keywords else "SAP"
+    return f"https://www.google.com/search?q=site:{domain}+{quote_plus(search_terms)}&num=10"
+
+
+# Checked in this order when a text mentions more than one country
+_COUNTRY_PRIORITY = ("Saudi Arabia", "UAE", "Qatar")
+
+
+def _country_matcher(terms: dict[str, list[str]]) -> tuple[re.Pattern, dict[str, str]]:
+    """Compile a country -> terms table into one regex plus a term -> country map.
+    The lookahead makes matches overlap, so every term occurring as a
+    substring is seen, exactly like per-term ``in`` checks."""
+    by_term = {term: country for country, words in terms.items() for term in words}
+    alternation = "|".join(map(re.escape, sorted(by_term, key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))", re.IGNORECASE), by_term
+
+
+def _match_country(text: str, pattern: re.Pattern, by_term: dict[str, str]) -> str:
+    """Single pass over text; returns the highest-priority country mentioned."""
+    found = {by_term[m.group(1).lower()] for m in pattern.finditer(text)}
+    for country in _COUNTRY_PRIORITY:
+        if country in found:
+            return country
+    return ""
+
+
+def _xp_class(name: str) -> str:
+    """XPath predicate for a CSS ``.name`` class match."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Visible text nodes only: script/style/template bodies are skipped
+_TEXT_NODES = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+
+
+def _text(el) -> str:
+    """Stripped text nodes of an element, concatenated."""
+    return "".join(s.strip() for s in _TEXT_NODES(el))
+
+
 class BaseScraper:
     """Base class for all scrapers with rate-limiting and retries."""
 
@@ -312,6 +443,15 @@ class BaseScraper:
         "SAP IBP", "SAP CX", "SAP Commerce Cloud", "SAP Signavio", "SAP Build",
     ]
 
+    # One case-insensitive pass over the text instead of lowercasing it and
+    # scanning once per product
+    _PRODUCT_RE = re.compile(
+        "|".join(re.escape(p) for p in sorted(SAP_PRODUCTS, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    # (lowercase form, product) in SAP_PRODUCTS order, for mapping matches back
+    _PRODUCT_KEYS = tuple((p.lower(), p) for p in SAP_PRODUCTS)
+
     _CHROME_HEADERS = {
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
         "Accept-Encoding": "gzip, deflate, br",
@@ -326,31 +466,291 @@ class BaseScraper:
         "Sec-Fetch-User": "?1",
         "Upgrade-Insecure-Requests": "1",
     }
+    # Recent desktop Chrome builds, each with the client hint it actually sends,
+    # so the rotated User-Agent never contradicts Sec-Ch-Ua above
+    _USER_AGENTS = {
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0.0.0 Safari/537.36":
+            '"Chromium";v="124", "Google Chrome";v="124", "Not-A.Brand";v="99"',
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/123.0.0.0 Safari/537.36":
+            '"Google Chrome";v="123", "Not:A-Brand";v="8", "Chromium";v="123"',
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36":
+            '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/121.0.0.0 Safari/537.36":
+            '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36":
+            '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    }
+    _UA_POOL = tuple(_USER_AGENTS)
+
+    # Every result we extract is anchored on a heading; pages without one
+    # (captcha / "unusual traffic" interstitials, empty SERPs) skip parsing
+    _RESULT_HEADING_RE = re.compile(rb"<h3[\s>]|role=[\"']heading", re.IGNORECASE)
+
+    # Google result blocks and the fields read from each, compiled once.
+    # "(...)[1]" is the first match in document order, like CSS select_one
+    _SERP_ITEMS = etree.XPath(f"//div[{_xp_class('g')} or @data-hveid]")
+    _NEWS_ITEMS = etree.XPath(f"//div[{_xp_class('g')} or @data-hveid or {_xp_class('SoaBEf')}]")
+    _SERP_TITLE = etree.XPath("(.//h3)[1]")
+    _NEWS_TITLE = etree.XPath("(.//*[self::h3 or @role='heading'])[1]")
+    _SERP_LINK = etree.XPath("(.//a[@href])[1]/@href")
+    _SERP_SNIPPET = etree.XPath(
+        f"(.//*[(self::div and ({_xp_class('VwiC3b')} or @data-sncf)) or (self::span and {_xp_class('st')})])[1]"
+    )
 
-    # Domains known to block scrapers — skip directly to Google fallback
-    _blocked_domains: set = set()
-
-    def __init__(self, rate_limit: float = 2.0):
-        self.session = requests.Session()
-        self.ua = UserAgent()
+    # <meta charset="..."> / http-equiv content="...; charset=..." in the page head
+    _META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+
+    # Cap on bytes read per response. Google result pages carry several
+    # hundred KB of inline script, so this leaves headroom while keeping
+    # oversized pages from being held (and parsed) in full
+    MAX_BODY_BYTES = 2 * 1024 * 1024
+
+    # (connect, read) seconds. Pooled connections skip the handshake, so a
+    # slow connect means a dead host and is abandoned early
+    TIMEOUT = (5, 15)
+
+    # Domains known to block scrapers — skip directly to Google fallback.
+    # Reads are plain set lookups; writes go through the lock since scraper
+    # threads can mark domains concurrently
+    _blocked_domains: set[str] = set()
+    _blocked_lock = threading.Lock()
+
+    # Next free request slot per host, shared by all scrapers so concurrent
+    # fetches never hit the same domain faster than the rate limit
+    _host_next_slot: dict[str, float] = {}
+    _host_lock = threading.Lock()
+
+    # In-memory LRU of fetched responses by URL, so a page requested by more
+    # than one query or scraper during a run is downloaded (and read back
+    # from the disk cache) only once. Bounded by entry count and by total
+    # body bytes, and emptied by run_agent once collection is over
+    RESPONSE_MEMO_SIZE = 64
+    RESPONSE_MEMO_BYTES = 32 * 1024 * 1024
+    _responses: OrderedDict[tuple, requests.Response] = OrderedDict()
+    _responses_bytes = 0
+    _responses_lock = threading.Lock()
+
+    # On-disk response cache used when requests-cache is installed
+    CACHE_NAME = ".sap_agent_cache"
+    CACHE_EXPIRE_SECONDS = 7 * 24 * 3600
+
+    # One session per cache mode, shared by every scraper so all sources
+    # reuse the same keep-alive connections (most of them hit google.com)
+    _sessions: dict[bool, requests.Session] = {}
+    _session_lock = threading.Lock()
+
+    # Cap on requests in flight across all scrapers and their thread pools,
+    # kept below the connection pool size so no request waits on a socket
+    MAX_IN_FLIGHT = 20
+    _in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+
+    def __init__(self, rate_limit: float = 2.0, max_workers: int = 8, use_cache: bool = True):
+        self.cached = use_cache and requests_cache is not None
+        self.session = self._shared_session(self.cached)
+        # Host -> User-Agent of its last successful request
+        self._host_ua: dict[str, str] = {}
         self.rate_limit = rate_limit
-        self._last_request_time = 0.0
-        self.session.headers.update(self._CHROME_HEADERS)
-        self.session.headers["User-Agent"] = self.ua.random
+        self.max_workers = max_workers
+
+    @classmethod
+    def _shared_session(cls, cached: bool) -> requests.Session:
+        """Return the process-wide session, creating it on first use."""
+        with BaseScraper._session_lock:
+            session = BaseScraper._sessions.get(cached)
+            if session is not None:
+                return session
+            if cached:
+                session = requests_cache.CachedSession(
+                    cache_name=cls.CACHE_NAME,
+                    backend="sqlite",
+                    expire_after=cls.CACHE_EXPIRE_SECONDS,
+                    allowable_codes=(200,),
+                    stale_if_error=True,
+                    # The session would read and store whole bodies before the
+                    # MAX_BODY_BYTES cap applies; _download writes the capped copy
+                    read_only=True,
+                )
+            else:
+                session = requests.Session()
+            # Keep-alive pool sized for the thread fan-out; retries are handled in fetch()
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(cls._CHROME_HEADERS)
+            if cached:
+                # A browser's "max-age=0" would make the cache revalidate every request
+                del session.headers["Cache-Control"]
+            session.headers["User-Agent"] = cls._UA_POOL[0]
+            atexit.register(session.close)
+            BaseScraper._sessions[cached] = session
+            return session
+
+    @classmethod
+    def clear_cache(cls) -> bool:
+        """Drop every entry from the on-disk response cache. Returns False
+        when requests-cache is not installed."""
+        if requests_cache is None:
+            return False
+        cls._shared_session(True).cache.clear()
+        return True
+
+    def _throttle(self, domain: str):
+        """Reserve the next request slot for a host and sleep until it opens."""
+        with BaseScraper._host_lock:
+            now = time.monotonic()
+            slot = max(now, BaseScraper._host_next_slot.get(domain, 0.0))
+            BaseScraper._host_next_slot[domain] = slot + self.rate_limit
+        if slot > now:
+            time.sleep(slot - now)
+
+    # lxml parsers are reused, but must not be shared between threads
+    _parsers = threading.local()
+
+    @classmethod
+    def _parser(cls, encoding: str) -> lxml.html.HTMLParser:
+        """This thread's HTML parser for a charset (raises LookupError if unknown)."""
+        parsers = cls._parsers.__dict__
+        parser = parsers.get(encoding)
+        if parser is None:
+            parser = parsers[encoding] = lxml.html.HTMLParser(encoding=encoding)
+        return parser
+
+    @classmethod
+    def html(cls, resp: requests.Response) -> Optional[lxml.html.HtmlElement]:
+        """Parse a response with lxml straight from its bytes, in the charset
+        _get() settled on. Returns None for an empty or unparseable body."""
+        try:
+            try:
+                parser = cls._parser(resp.encoding or "utf-8")
+            except LookupError:
+                # Unknown charset name: let libxml2 sniff the document itself
+                return lxml.html.document_fromstring(resp.content)
+            return lxml.html.document_fromstring(resp.content, parser=parser)
+        except (etree.ParserError, ValueError):
+            return None
+
+    def _serp_results(self, resp: requests.Response, limit: int, news: bool = False) -> list[tuple[str, str, str]]:
+        """(title, link, snippet) for each of the first ``limit`` Google result
+        blocks that has a title. Each field's text is extracted once."""
+        doc = self.html(resp)
+        if doc is None:
+            return []
+        items = (self._NEWS_ITEMS if news else self._SERP_ITEMS)(doc)[:limit]
+        title_xp = self._NEWS_TITLE if news else self._SERP_TITLE
+        results = []
+        for item in items:
+            title_el = title_xp(item)
+            if not title_el:
+                continue
+            link = self._SERP_LINK(item)
+            snippet_el = self._SERP_SNIPPET(item)
+            results.append((
+                _text(title_el[0]),
+                str(link[0]) if link else "",
+                _text(snippet_el[0]) if snippet_el else "",
+            ))
+        return results
 
-    def _throttle(self):
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request_time = time.time()
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET with the body streamed in and truncated at MAX_BODY_BYTES."""
+        with BaseScraper._in_flight:
+            return self._download(url, **kwargs)
 
-    def _rotate_headers(self):
-        """Rotate User-Agent and add jitter to appear more human."""
-        self.session.headers["User-Agent"] = self.ua.random
+    def _download(self, url: str, **kwargs) -> requests.Response:
+        resp = self.session.get(url, stream=True, timeout=self.TIMEOUT, allow_redirects=True, **kwargs)
+        try:
+            chunks, size = [], 0
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= self.MAX_BODY_BYTES:
+                    logger.debug("Truncating %s at %d bytes", url, self.MAX_BODY_BYTES)
+                    break
+            resp._content = b"".join(chunks)[:self.MAX_BODY_BYTES]
+        finally:
+            resp.close()
+        if self.cached and resp.status_code == 200 and not getattr(resp, "from_cache", False):
+            # Key on the original request so redirected URLs hit on the next run
+            cache = self.session.cache
+            first = resp.history[0] if resp.history else resp
+            cache.save_response(resp, cache.create_key(first.request),
+                                requests_cache.get_expiration_datetime(self.CACHE_EXPIRE_SECONDS))
+        if "charset=" not in resp.headers.get("Content-Type", "").lower():
+            # No charset header: take the page's <meta charset>, else UTF-8,
+            # instead of requests' Latin-1 default or a chardet guess on resp.text
+            m = self._META_CHARSET_RE.search(resp.content, 0, 2048)
+            resp.encoding = m.group(1).decode("ascii") if m else "utf-8"
+        return resp
+
+    def _is_cached(self, url: str, params: dict = None) -> bool:
+        """True when a fresh cached copy exists, so no throttle slot is needed."""
+        if not self.cached:
+            return False
+        cache = self.session.cache
+        cached = cache.responses.get(cache.create_key(requests.Request("GET", url, params=params)))
+        return cached is not None and not cached.is_expired
+
+    def _has_results(self, resp: requests.Response) -> bool:
+        """Cheap byte-level check that a result page is worth parsing at all."""
+        return self._RESULT_HEADING_RE.search(resp.content) is not None
+
+    def _rotate_headers(self, referer: str, domain: str = "") -> dict:
+        """Per-request headers. Passed to each request rather than set on the
+        session, which is shared between threads. A host keeps the User-Agent
+        that last worked for it; otherwise one is drawn from the pool."""
+        ua = self._host_ua.get(domain) or random.choice(self._UA_POOL)
+        return {"User-Agent": ua, "Sec-Ch-Ua": self._USER_AGENTS[ua], "Referer": referer}
+
+    def _collect(self, search, args_list: list) -> list[SAPSignal]:
+        """Run ``search(*args)`` for every entry on a bounded thread pool and
+        concatenate the resulting signals in input order. Repeated argument
+        tuples are searched once."""
+        args_list = list(dict.fromkeys(args_list))
+        if len(args_list) <= 1 or self.max_workers <= 1:
+            batches = [search(*args) for args in args_list]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(args_list))) as pool:
+                batches = list(pool.map(lambda args: search(*args), args_list))
+        return [sig for batch in batches for sig in batch]
 
     def fetch(self, url: str, params: dict = None, max_retries: int = 3) -> Optional[requests.Response]:
-        """Fetch URL with retries and rate limiting."""
-        parsed = urlparse(url)
+        """Fetch URL with retries and rate limiting, reusing a response already
+        fetched during this run."""
+        key = (url, tuple(sorted(params.items())) if params else ())
+        with BaseScraper._responses_lock:
+            resp = BaseScraper._responses.get(key)
+            if resp is not None:
+                BaseScraper._responses.move_to_end(key)
+                return resp
+        resp = self._fetch(url, params, max_retries)
+        if resp is not None and len(resp.content) <= self.RESPONSE_MEMO_BYTES:
+            memo = BaseScraper._responses
+            with BaseScraper._responses_lock:
+                old = memo.pop(key, None)
+                if old is not None:
+                    BaseScraper._responses_bytes -= len(old.content)
+                memo[key] = resp
+                BaseScraper._responses_bytes += len(resp.content)
+                while (len(memo) > self.RESPONSE_MEMO_SIZE
+                       or BaseScraper._responses_bytes > self.RESPONSE_MEMO_BYTES):
+                    _, evicted = memo.popitem(last=False)
+                    BaseScraper._responses_bytes -= len(evicted.content)
+        return resp
+
+    @classmethod
+    def clear_response_memo(cls):
+        """Drop every in-memory response kept by fetch()."""
+        with BaseScraper._responses_lock:
+            BaseScraper._responses.clear()
+            BaseScraper._responses_bytes = 0
+
+    def _fetch(self, url: str, params: dict, max_retries: int) -> Optional[requests.Response]:
+        parsed = _parse_url(url)
         domain = parsed.netloc
 
         # If this domain is already known to block us, skip direct fetch entirely
@@ -360,21 +760,25 @@ class BaseScraper:
 
         for attempt in range(max_retries):
             try:
-                self._throttle()
-                self._rotate_headers()
-                self.session.headers["Referer"] = f"{parsed.scheme}://{parsed.netloc}/"
-                resp = self.session.get(url, params=params, timeout=20, allow_redirects=True)
+                if not self._is_cached(url, params):
+                    self._throttle(domain)
+                headers = self._rotate_headers(f"{parsed.scheme}://{parsed.netloc}/", domain)
+                resp = self._get(url, params=params, headers=headers)
                 resp.raise_for_status()
+                self._host_ua[domain] = headers["User-Agent"]
                 return resp
             except requests.exceptions.HTTPError as e:
+                self._host_ua.pop(domain, None)
                 if e.response is not None and e.response.status_code == 403:
                     logger.warning("403 Forbidden from %s — marking domain as blocked", domain)
-                    BaseScraper._blocked_domains.add(domain)
+                    with BaseScraper._blocked_lock:
+                        BaseScraper._blocked_domains.add(domain)
                     return self._google_cache_fallback(url)
                 wait = 2 ** (attempt + 1)
                 logger.warning("Attempt %d failed for %s: %s — retry in %ds", attempt + 1, url, e, wait)
                 time.sleep(wait)
             except requests.RequestException as e:
+                self._host_ua.pop(domain, None)
                 wait = 2 ** (attempt + 1)
                 logger.warning("Attempt %d failed for %s: %s — retry in %ds", attempt + 1, url, e, wait)
                 time.sleep(wait)
@@ -384,16 +788,15 @@ class BaseScraper:
     def _google_cache_fallback(self, original_url: str) -> Optional[requests.Response]:
         """When a site blocks us, try Google's cached version or a Google
         search scoped to that site as a fallback."""
-        parsed = urlparse(original_url)
+        parsed = _parse_url(original_url)
         domain = parsed.netloc
 
         # Strategy 1: Google cache
         cache_url = f"https://webcache.googleusercontent.com/search?q=cache:{original_url}"
         try:
-            self._throttle()
-            self._rotate_headers()
-            self.session.headers["Referer"] = "https://www.google.com/"
-            resp = self.session.get(cache_url, timeout=20, allow_redirects=True)
+            self._throttle("webcache.googleusercontent.com")
+            headers = self._rotate_headers("https://www.google.com/")
+            resp = self._get(cache_url, headers=headers)
             if resp.status_code == 200:
                 logger.info("Google cache hit for %s", original_url)
                 return resp
@@ -401,16 +804,12 @@ class BaseScraper:
             pass
 
         # Strategy 2: Google search scoped to the domain + original query params
-        query_part = parsed.query or parsed.path
         # Extract meaningful keywords from the URL
-        keywords = re.findall(r'[a-zA-Z]{3,}', query_part)
-        search_terms = " ".join(keywords[:5]) if keywords else "SAP"
-        search_url = f"https://www.google.com/search?q=site:{domain}+{quote_plus(search_terms)}&num=10"
+        search_url = _site_search_url(domain, parsed.query or parsed.path)
         try:
-            self._throttle()
-            self._rotate_headers()
-            self.session.headers["Referer"] = "https://www.google.com/"
-            resp = self.session.get(search_url, timeout=20, allow_redirects=True)
+            self._throttle("www.google.com")
+            headers = self._rotate_headers("https://www.google.com/")
+            resp = self._get(search_url, headers=headers)
             if resp.status_code == 200:
                 logger.info("Google site-search fallback succeeded for %s", domain)
                 return resp
@@ -420,8 +819,22 @@ class BaseScraper:
         logger.warning("All fallback strategies failed for %s", original_url)
         return None
 
+    # Default country terms; scrapers with source-specific place or event
+    # names (e.g. "gitex") override the table
+    _COUNTRY_RE, _COUNTRY_BY_TERM = _country_matcher({
+        "Saudi Arabia": ["saudi", "riyadh", "jeddah", "ksa", "neom"],
+        "UAE": ["uae", "dubai", "abu dhabi", "emirates"],
+        "Qatar": ["qatar", "doha"],
+    })
+
+    def _infer_country(self, text: str) -> str:
+        return _match_country(text, self._COUNTRY_RE, self._COUNTRY_BY_TERM)
+
     def _detect_products(self, text: str) -> list[str]:
-        return [p for p in self.SAP_PRODUCTS if p.lower() in text.lower()]
+        found = {m.group(0).lower() for m in self._PRODUCT_RE.finditer(text)}
+        if not found:
+            return []
+        return [p for key, p in self._PRODUCT_KEYS if key in found]
 
 
 # ============================================================================
@@ -433,17 +846,17 @@ class SeedListSource:
 
     def scrape(self) -> list[SAPSignal]:
         signals = []
-        for entry in SEED_CUSTOMERS:
+        for company, country, products, industry in SEED_CUSTOMERS:
             signals.append(SAPSignal(
-                company=entry["company"],
-                country=entry["country"],
-                sap_products=entry["products"],
-                industry=entry.get("industry", ""),
+                company=company,
+                country=country,
+                sap_products=list(products),
+                industry=industry,
                 signal_type="seed",
                 signal_quality="High",
                 source_name="Curated Seed List",
                 source_url="",
-                summary=f"Known SAP customer — {entry.get('industry', 'N/A')}",
+                summary=f"Known SAP customer — {industry or 'N/A'}",
             ))
         logger.info("SeedListSource: %d signals", len(signals))
         return signals
@@ -459,41 +872,46 @@ class SAPCustomerStoriesScraper(BaseScraper):
     def scrape(self) -> list[SAPSignal]:
         signals = []
         # SAP customer stories search — filter by Middle East countries
-        for region_query in [
-            "Saudi Arabia", "UAE", "United Arab Emirates", "Qatar",
-            "Middle East", "GCC",
-        ]:
-            signals.extend(self._search_sap_stories(region_query))
+        signals.extend(self._collect(self._search_sap_stories, [
+            ("Saudi Arabia",), ("UAE",), ("United Arab Emirates",), ("Qatar",),
+            ("Middle East",), ("GCC",),
+        ]))
         # Also search SAP News Center
-        for query in [
-            "SAP customer Saudi Arabia", "SAP go-live UAE",
-            "SAP implementation Qatar", "SAP S/4HANA Middle East",
-        ]:
-            signals.extend(self._search_sap_news(query))
+        signals.extend(self._collect(self._search_sap_news, [
+            ("SAP customer Saudi Arabia",), ("SAP go-live UAE",),
+            ("SAP implementation Qatar",), ("SAP S/4HANA Middle East",),
+        ]))
         logger.info("SAPCustomerStoriesScraper: %d signals", len(signals))
         return signals
 
+    # One compiled pass each for "[class*='card'], [class*='story'], article,
+    # .customer-story" and "h2, h3, h4, [class*='title'], a[class*='title']"
+    _STORY_CARDS = etree.XPath("//*[self::article or contains(@class, 'card') or contains(@class, 'story')]")
+    _STORY_TITLE = etree.XPath("(.//*[self::h2 or self::h3 or self::h4 or contains(@class, 'title')])[1]")
+
     def _search_sap_stories(self, region: str) -> list[SAPSignal]:
         """Search SAP customer stories page."""
         url = f"https://www.sap.com/about/customer-stories.html?sort=latest_desc&tag=content:topic/region/{quote_plus(region)}"
         resp = self.fetch(url)
         if not resp:
             return []
-        soup = BeautifulSoup(resp.text, "lxml")
+        doc = self.html(resp)
+        if doc is None:
+            return []
         results = []
-        for card in soup.select("[class*='card'], [class*='story'], article, .customer-story")[:20]:
-            title_el = card.select_one("h2, h3, h4, [class*='title'], a[class*='title']")
+        for card in self._STORY_CARDS(doc)[:20]:
+            title_el = self._STORY_TITLE(card)
             if not title_el:
                 continue
-            title = title_el.get_text(strip=True)
-            link_el = card.select_one("a[href]")
-            link = link_el.get("href", "") if link_el else ""
+            title = _text(title_el[0])
+            link = self._SERP_LINK(card)
+            link = str(link[0]) if link else ""
             if link and not link.startswith("http"):
                 link = f"https://www.sap.com{link}"
             company = self._extract_customer_name(title)
             if is_excluded(company):
                 continue
-            country = self._infer_country(title + " " + card.get_text(strip=True))
+            country = self._infer_country(title + " " + _text(card))
             if not country:
                 continue
             results.append(SAPSignal(
@@ -508,19 +926,29 @@ class SAPCustomerStoriesScraper(BaseScraper):
             ))
         return results
 
+    # "article, .post-item, .search-result-item" / "h2 a, h3 a, .entry-title a"
+    _NEWS_ARTICLES = etree.XPath(
+        f"//*[self::article or {_xp_class('post-item')} or {_xp_class('search-result-item')}]"
+    )
+    _NEWS_ARTICLE_LINK = etree.XPath(
+        f"(.//a[ancestor::h2 or ancestor::h3 or ancestor::*[{_xp_class('entry-title')}]])[1]"
+    )
+
     def _search_sap_news(self, query: str) -> list[SAPSignal]:
         url = f"https://news.sap.com/?s={quote_plus(query)}"
         resp = self.fetch(url)
         if not resp:
             return []
-        soup = BeautifulSoup(resp.text, "lxml")
+        doc = self.html(resp)
+        if doc is None:
+            return []
         results = []
-        for article in soup.select("article, .post-item, .search-result-item")[:10]:
-            title_el = article.select_one("h2 a, h3 a, .entry-title a")
+        for article in self._NEWS_ARTICLES(doc)[:10]:
+            title_el = self._NEWS_ARTICLE_LINK(article)
             if not title_el:
                 continue
-            title = title_el.get_text(strip=True)
-            link = title_el.get("href", "")
+            title = _text(title_el[0])
+            link = title_el[0].get("href", "")
             company = self._extract_customer_name(title)
             if is_excluded(company):
                 continue
@@ -539,32 +967,26 @@ class SAPCustomerStoriesScraper(BaseScraper):
             ))
         return results
 
+    _CUSTOMER_NAME_PATTERNS = [
+        re.compile(r"^(.+?)\s+(?:selects|chooses|deploys|implements|goes live|adopts|migrates|transforms|runs|standardizes|accelerates)", re.IGNORECASE),
+        re.compile(r"^(.+?)\s+(?:and SAP|with SAP|partners with SAP)", re.IGNORECASE),
+        re.compile(r"(?:how|why|when)\s+(.+?)\s+(?:chose|selected|deployed|implemented|uses|leverages|adopted)\s+SAP", re.IGNORECASE),
+    ]
+
     def _extract_customer_name(self, title: str) -> str:
-        patterns = [
-            r"^(.+?)\s+(?:selects|chooses|deploys|implements|goes live|adopts|migrates|transforms|runs|standardizes|accelerates)",
-            r"^(.+?)\s+(?:and SAP|with SAP|partners with SAP)",
-            r"(?:how|why|when)\s+(.+?)\s+(?:chose|selected|deployed|implemented|uses|leverages|adopted)\s+SAP",
-        ]
-        for pat in patterns:
-            m = re.search(pat, title, re.IGNORECASE)
+        for pat in self._CUSTOMER_NAME_PATTERNS:
+            m = pat.search(title)
             if m:
                 name = m.group(1).strip()
                 if len(name) > 2 and not is_excluded(name):
                     return name[:80]
         return title[:60]
 
-    def _infer_country(self, text: str) -> str:
-        text_lower = text.lower()
-        sa_terms = ["saudi", "riyadh", "jeddah", "dammam", "ksa", "neom"]
-        uae_terms = ["uae", "dubai", "abu dhabi", "sharjah", "emirates"]
-        qatar_terms = ["qatar", "doha"]
-        if any(t in text_lower for t in sa_terms):
-            return "Saudi Arabia"
-        if any(t in text_lower for t in uae_terms):
-            return "UAE"
-        if any(t in text_lower for t in qatar_terms):
-            return "Qatar"
-        return ""
+    _COUNTRY_RE, _COUNTRY_BY_TERM = _country_matcher({
+        "Saudi Arabia": ["saudi", "riyadh", "jeddah", "dammam", "ksa", "neom"],
+        "UAE": ["uae", "dubai", "abu dhabi", "sharjah", "emirates"],
+        "Qatar": ["qatar", "doha"],
+    })
 
 
 # ============================================================================
@@ -585,11 +1007,11 @@ class PressReleaseScraper(BaseScraper):
     ]
 
     def scrape(self) -> list[SAPSignal]:
-        signals: list[SAPSignal] = []
-        for region in ["Saudi Arabia", "UAE", "Qatar"]:
-            for pattern in self.QUERIES:
-                query = pattern.format(region=region)
-                signals.extend(self._search_google_news(query, region))
+        signals: list[SAPSignal] = self._collect(self._search_google_news, [
+            (pattern.format(region=region), region)
+            for region in ["Saudi Arabia", "UAE", "Qatar"]
+            for pattern in self.QUERIES
+        ])
         logger.info("PressReleaseScraper: %d signals", len(signals))
         return signals
 
@@ -603,17 +1025,10 @@ class PressReleaseScraper(BaseScraper):
             resp = self.fetch(url)
             if not resp:
                 return []
-        soup = BeautifulSoup(resp.text, "lxml")
+        if not self._has_results(resp):
+            return []
         results = []
-        for item in soup.select("div.g, div[data-hveid], div.SoaBEf")[:10]:
-            title_el = item.select_one("h3, [role='heading']")
-            link_el = item.select_one("a[href]")
-            snippet_el = item.select_one("div.VwiC3b, span.st, div[data-sncf]")
-            if not title_el:
-                continue
-            title = title_el.get_text(strip=True)
-            link = link_el.get("href", "") if link_el else ""
-            snippet = snippet_el.get_text(strip=True) if snippet_el else ""
+        for title, link, snippet in self._serp_results(resp, 10, news=True):
             combined = f"{title} {snippet}"
             company = self._extract_customer(combined)
             if is_excluded(company):
@@ -634,30 +1049,22 @@ class PressReleaseScraper(BaseScraper):
             ))
         return results
 
+    _CUSTOMER_PATTERNS = [
+        re.compile(r"(.+?)\s+(?:implements|deploys|selects|goes live|adopts|chooses|migrates to|transforms with)\s+SAP", re.IGNORECASE),
+        re.compile(r"SAP\s+(?:and|&)\s+(.+?)\s+(?:announce|partner|collaborate)", re.IGNORECASE),
+    ]
+    _LEADING_ADVERB_RE = re.compile(r"^(how|why|when|as)\s+", re.IGNORECASE)
+
     def _extract_customer(self, text: str) -> str:
-        patterns = [
-            r"(.+?)\s+(?:implements|deploys|selects|goes live|adopts|chooses|migrates to|transforms with)\s+SAP",
-            r"SAP\s+(?:and|&)\s+(.+?)\s+(?:announce|partner|collaborate)",
-        ]
-        for pat in patterns:
-            m = re.search(pat, text, re.IGNORECASE)
+        for pat in self._CUSTOMER_PATTERNS:
+            m = pat.search(text)
             if m:
                 name = m.group(1).strip()
-                name = re.sub(r'^(how|why|when|as)\s+', '', name, flags=re.IGNORECASE).strip()
+                name = self._LEADING_ADVERB_RE.sub("", name).strip()
                 if len(name) > 2 and not is_excluded(name):
                     return name[:80]
         return text[:60]
 
-    def _infer_country(self, text: str) -> str:
-        text_lower = text.lower()
-        if any(t in text_lower for t in ["saudi", "riyadh", "jeddah", "ksa", "neom"]):
-            return "Saudi Arabia"
-        if any(t in text_lower for t in ["uae", "dubai", "abu dhabi", "emirates"]):
-            return "UAE"
-        if any(t in text_lower for t in ["qatar", "doha"]):
-            return "Qatar"
-        return ""
-
 
 # ============================================================================
 # SOURCE 4: JOB POSTINGS (filtered for end-customers only)
@@ -696,71 +1103,73 @@ class JobPostingScraper(BaseScraper):
         return signals
 
     def _scrape_google_jobs(self) -> list[SAPSignal]:
+        return self._collect(self._search_google_jobs, [
+            (country, query)
+            for country, queries in self.GOOGLE_QUERIES.items()
+            for query in queries
+        ])
+
+    def _search_google_jobs(self, country: str, query: str) -> list[SAPSignal]:
+        url = f"https://www.google.com/search?q={quote_plus(query)}&num=15"
+        resp = self.fetch(url)
+        if not resp or not self._has_results(resp):
+            return []
         results = []
-        for country, queries in self.GOOGLE_QUERIES.items():
-            for query in queries:
-                url = f"https://www.google.com/search?q={quote_plus(query)}&num=15"
-                resp = self.fetch(url)
-                if not resp:
-                    continue
-                soup = BeautifulSoup(resp.text, "lxml")
-                for g_result in soup.select("div.g, div[data-hveid]")[:15]:
-                    title_el = g_result.select_one("h3")
-                    link_el = g_result.select_one("a[href]")
-                    snippet_el = g_result.select_one("div.VwiC3b, span.st, div[data-sncf]")
-                    if not title_el:
-                        continue
-                    title = title_el.get_text(strip=True)
-                    link = link_el.get("href", "") if link_el else ""
-                    snippet = snippet_el.get_text(strip=True) if snippet_el else ""
-                    combined = f"{title} {snippet}"
-                    company = self._extract_hiring_company(title, snippet)
-                    if is_excluded(company):
-                        continue
-                    results.append(SAPSignal(
-                        company=company,
-                        country=country,
-                        sap_products=self._infer_sap_role(combined),
-                        signal_type="job_posting",
-                        signal_quality="Medium",
-                        source_name="Job Posting",
-                        source_url=link,
-                        summary=f"Hiring SAP staff: {title[:150]}",
-                    ))
+        for title, link, snippet in self._serp_results(resp, 15):
+            combined = f"{title} {snippet}"
+            company = self._extract_hiring_company(title, snippet)
+            if is_excluded(company):
+                continue
+            results.append(SAPSignal(
+                company=company,
+                country=country,
+                sap_products=self._infer_sap_role(combined),
+                signal_type="job_posting",
+                signal_quality="Medium",
+                source_name="Job Posting",
+                source_url=link,
+                summary=f"Hiring SAP staff: {title[:150]}",
+            ))
         return results
 
+    _HIRING_COMPANY_PATTERNS = [
+        re.compile(r"(?:at|@)\s+(.+?)(?:\s*[-–|,]|\s*$)", re.IGNORECASE),
+        re.compile(r"[-–|]\s*(.+?)(?:\s*[-–|,]|\s*$)", re.IGNORECASE),
+        re.compile(r"^(.+?)\s+(?:is hiring|is looking|seeks|recruiting|careers)", re.IGNORECASE),
+    ]
+
     def _extract_hiring_company(self, title: str, snippet: str) -> str:
-        patterns = [
-            r"(?:at|@)\s+(.+?)(?:\s*[-–|,]|\s*$)",
-            r"[-–|]\s*(.+?)(?:\s*[-–|,]|\s*$)",
-            r"^(.+?)\s+(?:is hiring|is looking|seeks|recruiting|careers)",
-        ]
+        patterns = self._HIRING_COMPANY_PATTERNS
         for pat in patterns:
-            m = re.search(pat, title, re.IGNORECASE)
+            m = pat.search(title)
             if m:
                 name = m.group(1).strip()
                 if len(name) > 3 and not is_excluded(name):
                     return name[:80]
         for pat in patterns[:2]:
-            m = re.search(pat, snippet, re.IGNORECASE)
+            m = pat.search(snippet)
             if m:
                 name = m.group(1).strip()
                 if len(name) > 3 and not is_excluded(name):
                     return name[:80]
         return title[:60]
 
+    _ROLE_MAP = {
+        "fiori": "SAP Fiori", "abap": "SAP S/4HANA", "s/4": "SAP S/4HANA",
+        "s4hana": "SAP S/4HANA", "btp": "SAP BTP", "successfactors": "SAP SuccessFactors",
+        "ariba": "SAP Ariba", "concur": "SAP Concur", "analytics cloud": "SAP Analytics Cloud",
+        "hana": "SAP HANA", "commerce cloud": "SAP Commerce Cloud", "ibp": "SAP IBP",
+    }
+    # Overlapping lookahead so "s4hana" still yields "hana", as substring checks did
+    _ROLE_RE = re.compile(
+        "(?=(" + "|".join(map(re.escape, sorted(_ROLE_MAP, key=len, reverse=True))) + "))",
+        re.IGNORECASE,
+    )
+
     def _infer_sap_role(self, text: str) -> list[str]:
-        role_map = {
-            "fiori": "SAP Fiori", "abap": "SAP S/4HANA", "s/4": "SAP S/4HANA",
-            "s4hana": "SAP S/4HANA", "btp": "SAP BTP", "successfactors": "SAP SuccessFactors",
-            "ariba": "SAP Ariba", "concur": "SAP Concur", "analytics cloud": "SAP Analytics Cloud",
-            "hana": "SAP HANA", "commerce cloud": "SAP Commerce Cloud", "ibp": "SAP IBP",
-        }
-        products = []
-        text_lower = text.lower()
-        for keyword, product in role_map.items():
-            if keyword in text_lower and product not in products:
-                products.append(product)
+        hits = {m.group(1).lower() for m in self._ROLE_RE.finditer(text)}
+        # Keep the map's order and drop duplicate products in one pass
+        products = list(dict.fromkeys(p for k, p in self._ROLE_MAP.items() if k in hits))
         return products if products else ["SAP (unspecified)"]
 
 
@@ -793,53 +1202,52 @@ class ProcurementScraper(BaseScraper):
     }
 
     def scrape(self) -> list[SAPSignal]:
-        signals = []
-        for country, queries in self.QUERIES.items():
-            for query in queries:
-                url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
-                resp = self.fetch(url)
-                if not resp:
-                    continue
-                soup = BeautifulSoup(resp.text, "lxml")
-                for item in soup.select("div.g, div[data-hveid]")[:10]:
-                    title_el = item.select_one("h3")
-                    link_el = item.select_one("a[href]")
-                    snippet_el = item.select_one("div.VwiC3b, span.st, div[data-sncf]")
-                    if not title_el:
-                        continue
-                    title = title_el.get_text(strip=True)
-                    link = link_el.get("href", "") if link_el else ""
-                    snippet = snippet_el.get_text(strip=True) if snippet_el else ""
-                    combined = f"{title} {snippet}".lower()
-                    if "sap" not in combined and "erp" not in combined:
-                        continue
-                    company = self._extract_org(title, snippet)
-                    if is_excluded(company):
-                        continue
-                    signals.append(SAPSignal(
-                        company=company,
-                        country=country,
-                        sap_products=self._detect_products(f"{title} {snippet}"),
-                        industry="Government",
-                        signal_type="procurement",
-                        signal_quality="Medium",
-                        source_name="Procurement",
-                        source_url=link,
-                        summary=f"{title[:150]}",
-                    ))
+        signals = self._collect(self._search, [
+            (country, query)
+            for country, queries in self.QUERIES.items()
+            for query in queries
+        ])
         logger.info("ProcurementScraper: %d signals", len(signals))
         return signals
 
+    def _search(self, country: str, query: str) -> list[SAPSignal]:
+        url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
+        resp = self.fetch(url)
+        if not resp or not self._has_results(resp):
+            return []
+        results = []
+        for title, link, snippet in self._serp_results(resp, 10):
+            combined = f"{title} {snippet}"
+            combined_lower = combined.lower()
+            if "sap" not in combined_lower and "erp" not in combined_lower:
+                continue
+            company = self._extract_org(title, snippet)
+            if is_excluded(company):
+                continue
+            results.append(SAPSignal(
+                company=company,
+                country=country,
+                sap_products=self._detect_products(combined),
+                industry="Government",
+                signal_type="procurement",
+                signal_quality="Medium",
+                source_name="Procurement",
+                source_url=link,
+                summary=f"{title[:150]}",
+            ))
+        return results
+
+    _ORG_PATTERNS = [
+        re.compile(r"(.+?)\s+(?:implements|deploys|selects|awards|goes live|adopts|migrates to|signs|announces)\s+(?:SAP|ERP)", re.IGNORECASE),
+        re.compile(r"^(.+?)\s+(?:tender|procurement|rfp|bid|contract)", re.IGNORECASE),
+        re.compile(r"^(.+?)\s+(?:awards|issues|publishes)", re.IGNORECASE),
+        re.compile(r"(?:Ministry of|Department of|Authority of)\s+(.+?)(?:\s+[-–|,.]|\s+(?:implements|deploys))", re.IGNORECASE),
+    ]
+
     def _extract_org(self, title: str, snippet: str = "") -> str:
         combined = f"{title} {snippet}"
-        patterns = [
-            r"(.+?)\s+(?:implements|deploys|selects|awards|goes live|adopts|migrates to|signs|announces)\s+(?:SAP|ERP)",
-            r"^(.+?)\s+(?:tender|procurement|rfp|bid|contract)",
-            r"^(.+?)\s+(?:awards|issues|publishes)",
-            r"(?:Ministry of|Department of|Authority of)\s+(.+?)(?:\s+[-–|,.]|\s+(?:implements|deploys))",
-        ]
-        for pat in patterns:
-            m = re.search(pat, combined, re.IGNORECASE)
+        for pat in self._ORG_PATTERNS:
+            m = pat.search(combined)
             if m:
                 name = m.group(1).strip()
                 if len(name) > 3 and not is_excluded(name):
@@ -855,7 +1263,6 @@ class ConferenceScraper(BaseScraper):
     """Searches for SAP-related conference speakers and event mentions from GCC."""
 
     def scrape(self) -> list[SAPSignal]:
-        signals = []
         queries = [
             # Event-specific queries
             '"SAP" LEAP Riyadh speaker OR customer OR session',
@@ -867,160 +1274,202 @@ class ConferenceScraper(BaseScraper):
             # SAP-specific partner/customer events
             '"SAP" "customer success" OR "go-live" OR "digital transformation" GCC OR "Middle East"',
         ]
-        for query in queries:
-            url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
-            resp = self.fetch(url)
-            if not resp:
-                continue
-            soup = BeautifulSoup(resp.text, "lxml")
-            for item in soup.select("div.g, div[data-hveid]")[:10]:
-                title_el = item.select_one("h3")
-                link_el = item.select_one("a[href]")
-                snippet_el = item.select_one("div.VwiC3b, span.st, div[data-sncf]")
-                if not title_el:
-                    continue
-                title = title_el.get_text(strip=True)
-                snippet = snippet_el.get_text(strip=True) if snippet_el else ""
-                link = link_el.get("href", "") if link_el else ""
-                combined = f"{title} {snippet}"
-                if "sap" not in combined.lower():
-                    continue
-                company = self._extract_speaker_org(combined)
-                if is_excluded(company):
-                    continue
-                country = self._infer_country(combined)
-                if not country:
-                    country = "GCC"
-                signals.append(SAPSignal(
-                    company=company,
-                    country=country,
-                    sap_products=self._detect_products(combined),
-                    signal_type="conference",
-                    signal_quality="Medium",
-                    source_name="Conference/Event",
-                    source_url=link,
-                    summary=title[:200],
-                ))
+        signals = self._collect(self._search, [(query,) for query in queries])
         logger.info("ConferenceScraper: %d signals", len(signals))
         return signals
 
+    def _search(self, query: str) -> list[SAPSignal]:
+        url = f"https://www.google.com/search?q={quote_plus(query)}&num=10"
+        resp = self.fetch(url)
+        if not resp or not self._has_results(resp):
+            return []
+        results = []
+        for title, link, snippet in self._serp_results(resp, 10):
+            combined = f"{title} {snippet}"
+            if "sap" not in combined.lower():
+                continue
+            company = self._extract_speaker_org(combined)
+            if is_excluded(company):
+                continue
+            country = self._infer_country(combined)
+            if not country:
+                country = "GCC"
+            results.append(SAPSignal(
+                company=company,
+                country=country,
+                sap_products=self._detect_products(combined),
+                signal_type="conference",
+                signal_quality="Medium",
+                source_name="Conference/Event",
+                source_url=link,
+                summary=title[:200],
+            ))
+        return results
+
+    _SPEAKER_ORG_PATTERNS = [
+        re.compile(r"(?:from|of|at|with)\s+(.+?)(?:\s*[-–|,.]|\s+(?:speaks|presents|discusses|shares|announces|showcases))", re.IGNORECASE),
+        re.compile(r"(.+?)\s+(?:shares|presents|showcases|announces|discusses)\s+.*?SAP", re.IGNORECASE),
+        re.compile(r"(.+?)\s+(?:at|during)\s+(?:LEAP|GITEX|SAP Now|SAP Sapphire)", re.IGNORECASE),
+    ]
+
     def _extract_speaker_org(self, text: str) -> str:
-        patterns = [
-            r"(?:from|of|at|with)\s+(.+?)(?:\s*[-–|,.]|\s+(?:speaks|presents|discusses|shares|announces|showcases))",
-            r"(.+?)\s+(?:shares|presents|showcases|announces|discusses)\s+.*?SAP",
-            r"(.+?)\s+(?:at|during)\s+(?:LEAP|GITEX|SAP Now|SAP Sapphire)",
-        ]
-        for pat in patterns:
-            m = re.search(pat, text, re.IGNORECASE)
+        for pat in self._SPEAKER_ORG_PATTERNS:
+            m = pat.search(text)
             if m:
                 name = m.group(1).strip()
                 if len(name) > 3 and not is_excluded(name):
                     return name[:80]
         return text[:60]
 
-    def _infer_country(self, text: str) -> str:
-        text_lower = text.lower()
-        if any(t in text_lower for t in ["saudi", "riyadh", "leap", "ksa"]):
-            return "Saudi Arabia"
-        if any(t in text_lower for t in ["uae", "dubai", "abu dhabi", "gitex"]):
-            return "UAE"
-        if any(t in text_lower for t in ["qatar", "doha"]):
-            return "Qatar"
-        return ""
+    _COUNTRY_RE, _COUNTRY_BY_TERM = _country_matcher({
+        "Saudi Arabia": ["saudi", "riyadh", "leap", "ksa"],
+        "UAE": ["uae", "dubai", "abu dhabi", "gitex"],
+        "Qatar": ["qatar", "doha"],
+    })
 
 
 # ============================================================================
 # AGGREGATION & DEDUPLICATION (with exclusion filtering)
 # ============================================================================
 
+# Any run of trailing legal-form suffixes ("Foo Group LLC" -> "Foo")
+_COMPANY_SUFFIX_RE = re.compile(
+    r"(?:\s+(?:LLC|Ltd\.?|Inc\.?|Corp|Group|Holdings|FZE|WLL|PJSC|PSC|BSC|QSC|Co\.|Company))+$",
+    re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def normalize_company(name: str) -> str:
     """Normalize company name for deduplication."""
-    name = name.strip()
-    for suffix in [" LLC", " Ltd", " Ltd.", " Inc", " Inc.", " Corp", " Group",
-                   " Holdings", " FZE", " WLL", " PJSC", " PSC", " BSC", " QSC",
-                   " Co.", " Company"]:
-        if name.lower().endswith(suffix.lower()):
-            name = name[: -len(suffix)].strip()
-    name = re.sub(r"\s+", " ", name)
+    name = _COMPANY_SUFFIX_RE.sub("", name.strip())
+    name = _WHITESPACE_RE.sub(" ", name)
     return name.strip().lower()
 
 
-def deduplicate_signals(signals: list[SAPSignal]) -> list[dict]:
-    """Group signals by company, filter exclusions, compute corroboration scores.
-    Preserves evidence (URLs, summaries, dates) for board-level presentation."""
-    company_map: dict[str, dict] = defaultdict(lambda: {
-        "company": "",
-        "country": "",
-        "sap_products": set(),
-        "industries": set(),
-        "signal_types": set(),
-        "sources": [],
-        "evidence": [],        # list of {type, source, url, summary, date}
-        "signal_count": 0,
-        "best_quality": "Low",
-    })
+class _CompanyRecord:
+    """Per-company accumulator for deduplicate_signals."""
+    __slots__ = ("company", "country", "products", "industries", "types",
+                 "sources", "evidence", "count", "best_q")
+
+    def __init__(self):
+        self.company = ""
+        self.country = ""
+        self.products: set[str] = set()
+        self.industries: set[str] = set()
+        self.types: set[str] = set()
+        self.sources: dict[str, None] = {}  # ordered set: first-seen order
+        self.evidence: list[dict] = []  # list of {type, source, url, summary, date}
+        self.count = 0
+        self.best_q = _QUALITY_RANK["Low"]
+
+    def to_dict(self) -> dict:
+        signal_types = sorted(self.types)
+        # Deduplicate evidence by URL (keep unique entries)
+        seen_urls = set()
+        unique_evidence = []
+        for ev in self.evidence:
+            ev_key = ev["url"] or ev["summary"]
+            if ev_key not in seen_urls:
+                seen_urls.add(ev_key)
+                unique_evidence.append(ev)
+        return {
+            "company": self.company,
+            "country": self.country,
+            "sap_products": sorted(self.products),
+            "industries": sorted(self.industries),
+            "signal_types": signal_types,
+            "sources": list(self.sources),
+            "evidence": unique_evidence,
+            "signal_count": self.count,
+            "best_quality": _QUALITY_NAMES[self.best_q],
+            "corroboration_score": len(signal_types),
+        }
+
 
-    quality_rank = {"High": 3, "Medium": 2, "Low": 1, "": 0}
+def deduplicate_signals(signals: list[SAPSignal], top_k: Optional[int] = None) -> list[dict]:
+    """Group signals by company, filter exclusions, compute corroboration scores.
+    Preserves evidence (URLs, summaries, dates) for board-level presentation.
+    With ``top_k``, only the best-scored ``top_k`` companies are returned."""
+    company_map: dict[str, _CompanyRecord] = {}
 
     for sig in signals:
         # Filter out excluded companies
         if is_excluded(sig.company):
             continue
 
-        key = normalize_company(sig.company)
-        if not key or len(key) < 3:
+        key = sig.norm_key
+        if len(key) < 3:
             continue
 
-        rec = company_map[key]
-        if len(sig.company) > len(rec["company"]):
-            rec["company"] = sig.company
+        rec = company_map.get(key)
+        if rec is None:
+            rec = company_map[key] = _CompanyRecord()
+        if len(sig.company) > len(rec.company):
+            rec.company = sig.company
         if sig.country and sig.country != "GCC":
-            rec["country"] = sig.country
-        elif not rec["country"]:
-            rec["country"] = sig.country
-        rec["sap_products"].update(sig.sap_products)
+            rec.country = sig.country
+        elif not rec.country:
+            rec.country = sig.country
+        rec.products.update(sig.sap_products)
         if sig.industry:
-            rec["industries"].add(sig.industry)
-        rec["signal_types"].add(sig.signal_type)
-        if sig.source_name and sig.source_name not in rec["sources"]:
-            rec["sources"].append(sig.source_name)
+            rec.industries.add(sig.industry)
+        rec.types.add(sig.signal_type)
+        if sig.source_name:
+            rec.sources[sig.source_name] = None
         # Preserve evidence for this signal
-        rec["evidence"].append({
+        rec.evidence.append({
             "type": sig.signal_type,
             "source": sig.source_name,
             "url": sig.source_url,
             "summary": sig.summary,
             "date": sig.date_detected,
         })
-        rec["signal_count"] += 1
-        if quality_rank.get(sig.signal_quality, 0) > quality_rank.get(rec["best_quality"], 0):
-            rec["best_quality"] = sig.signal_quality
-
-    results = []
-    for key, rec in company_map.items():
-        # Final exclusion check on normalized key
-        if is_excluded(key):
-            continue
-        rec["sap_products"] = sorted(rec["sap_products"])
-        rec["industries"] = sorted(rec["industries"])
-        rec["signal_types"] = sorted(rec["signal_types"])
-        rec["corroboration_score"] = len(rec["signal_types"])
-        # Deduplicate evidence by URL (keep unique entries)
-        seen_urls = set()
-        unique_evidence = []
-        for ev in rec["evidence"]:
-            ev_key = ev["url"] or ev["summary"]
-            if ev_key not in seen_urls:
-                seen_urls.add(ev_key)
-                unique_evidence.append(ev)
-        rec["evidence"] = unique_evidence
-        results.append(rec)
-
-    results.sort(key=lambda r: (r["corroboration_score"], r["signal_count"]), reverse=True)
+        rec.count += 1
+        if sig.quality_num > rec.best_q:
+            rec.best_q = sig.quality_num
+
+    # Final exclusion check on normalized key
+    records = [rec for key, rec in company_map.items() if not is_excluded(key)]
+
+    # Rank before building output dicts, so a top_k selection only pays for
+    # the companies it keeps
+    def score(rec: _CompanyRecord) -> tuple[int, int]:
+        return len(rec.types), rec.count
+
+    if top_k is not None:
+        records = heapq.nlargest(top_k, records, key=score)
+    else:
+        records.sort(key=score, reverse=True)
+    results = [rec.to_dict() for rec in records]
     logger.info("Deduplication: %d signals → %d unique companies", len(signals), len(results))
     return results
 
 
+# ============================================================================
+# SIGNAL EXPORT
+# ============================================================================
+
+def export_signals_jsonl(signals: list[SAPSignal], output_dir: str = "output") -> str:
+    """Write raw signals as JSON Lines next to the report and return the path."""
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = os.path.join(output_dir, f"SAP_Signals_GCC_{date.today().isoformat()}.jsonl")
+    with open(filepath, "wb") as fh:
+        fh.write(b"".join(sig.to_json_bytes() for sig in signals))
+    logger.info("Signals exported: %s (%d records)", filepath, len(signals))
+    return filepath
+
+
+def load_signals_jsonl(filepath: str) -> list[SAPSignal]:
+    """Read signals back from a file written by export_signals_jsonl."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(filepath, "rb") as fh:
+        signals = [SAPSignal(**loads(line)) for line in fh if line.strip()]
+    logger.info("Signals loaded: %s (%d records)", filepath, len(signals))
+    return signals
+
+
 # ============================================================================
 # PPTX REPORT GENERATION
 # ============================================================================
@@ -1029,34 +1478,58 @@ class ReportGenerator:
     """Generates professional PPTX report from aggregated signals."""
 
     def __init__(self, output_dir: str = "output"):
+        _load_pptx()
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
-
-    def generate(self, companies: list[dict], raw_count: int) -> str:
+        # Lengths used on every slide or inside per-row/per-cell loops,
+        # converted once rather than at each use
+        self._title_box = (Inches(0.5), Inches(0.3), Inches(12), Inches(0.9))
+        self._title_pt = Pt(28)
+        self._header_pt = Pt(10)
+        self._cell_pt = Pt(8)
+        self._evidence_pt = Pt(8)
+        self._evidence_gap = Pt(2)
+        # Module colors stay plain tuples; the pptx values live on the instance
+        self._blue = RGBColor(*SAP_BLUE)
+        self._dark = RGBColor(*SAP_DARK)
+        self._gold = RGBColor(*SAP_GOLD)
+        self._white = RGBColor(*WHITE)
+        self._gray = RGBColor(*GRAY)
+
+    def generate(self, companies: list[dict], raw_count: int,
+                 incomplete_sources: list[str] | None = None) -> str:
         prs = Presentation()
         prs.slide_width = Inches(13.333)
         prs.slide_height = Inches(7.5)
+        # Every slide uses the blank layout; resolve it once
+        self._blank_layout = prs.slide_layouts[6]
 
-        self._add_title_slide(prs, companies, raw_count)
-        self._add_executive_summary(prs, companies)
-        self._add_country_breakdown(prs, companies)
-        self._add_industry_breakdown(prs, companies)
-        self._add_products(prs, companies)
+        stats = self._aggregate(companies)
+        self._add_title_slide(prs, stats, raw_count)
+        self._add_executive_summary(prs, stats)
+        self._add_country_breakdown(prs, stats)
+        self._add_industry_breakdown(prs, stats)
+        self._add_products(prs, stats)
 
         for country in ["Saudi Arabia", "UAE", "Qatar"]:
-            self._add_company_table(prs, companies, country)
+            self._add_company_table(prs, stats["by_country"].get(country, []), country)
 
-        self._add_high_confidence(prs, companies)
+        self._add_high_confidence(prs, stats["high_conf"])
         self._add_evidence_detail(prs, companies)
-        self._add_methodology(prs)
+        self._add_methodology(prs, incomplete_sources)
 
         base_name = f"SAP_Customer_Intelligence_GCC_{date.today().isoformat()}"
         filepath = os.path.join(self.output_dir, f"{base_name}.pptx")
 
+        # Serialize once up front; a locked-file retry then only rewrites bytes
+        buf = io.BytesIO()
+        prs.save(buf)
+
         # If the file is locked (e.g. open in PowerPoint), auto-increment suffix
         for attempt in range(10):
             try:
-                prs.save(filepath)
+                with open(filepath, "wb") as f:
+                    f.write(buf.getbuffer())
                 logger.info("Report saved: %s", filepath)
                 return filepath
             except PermissionError:
@@ -1070,11 +1543,49 @@ class ReportGenerator:
             f"Please close the .pptx file in PowerPoint and re-run."
         )
 
-    def _add_title_slide(self, prs, companies, raw_count):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+    @staticmethod
+    def _aggregate(companies: list[dict]) -> dict:
+        """Every count and grouping the slides need, gathered in one pass."""
+        countries = Counter()
+        industries = Counter()
+        products = Counter()
+        per_country = defaultdict(lambda: {"count": 0, "products": Counter(), "industries": Counter()})
+        by_country = defaultdict(list)
+        high_conf = []
+        s4_count = 0
+        for c in companies:
+            cn = c["country"]
+            countries[cn] += 1
+            industries.update(c["industries"])
+            products.update(c["sap_products"])
+            entry = per_country[cn]
+            entry["count"] += 1
+            entry["products"].update(c["sap_products"])
+            entry["industries"].update(c["industries"])
+            by_country[cn].append(c)
+            if c["corroboration_score"] >= 2:
+                high_conf.append(c)
+            if "SAP S/4HANA" in c["sap_products"]:
+                s4_count += 1
+        return {
+            "total": len(companies),
+            "countries": countries,
+            # Ranked once here; slides take slices (most_common(15)[:8] is
+            # exactly most_common(8))
+            "top_countries": countries.most_common(),
+            "top_industries": industries.most_common(15),
+            "top_products": products.most_common(12),
+            "per_country": per_country,
+            "by_country": by_country,
+            "high_conf": high_conf,
+            "s4_count": s4_count,
+        }
+
+    def _add_title_slide(self, prs, stats, raw_count):
+        slide = prs.slides.add_slide(self._blank_layout)
         bg = slide.background.fill
         bg.solid()
-        bg.fore_color.rgb = SAP_DARK
+        bg.fore_color.rgb = self._dark
 
         txBox = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(11), Inches(2))
         tf = txBox.text_frame
@@ -1083,138 +1594,92 @@ class ReportGenerator:
         p.text = "SAP Customer Intelligence Report"
         p.font.size = Pt(40)
         p.font.bold = True
-        p.font.color.rgb = WHITE
+        p.font.color.rgb = self._white
 
         p2 = tf.add_paragraph()
         p2.text = "Saudi Arabia | UAE | Qatar"
         p2.font.size = Pt(24)
-        p2.font.color.rgb = SAP_GOLD
+        p2.font.color.rgb = self._gold
 
-        sa_count = sum(1 for c in companies if c["country"] == "Saudi Arabia")
-        uae_count = sum(1 for c in companies if c["country"] == "UAE")
-        qa_count = sum(1 for c in companies if c["country"] == "Qatar")
+        countries = stats["countries"]
+        sa_count = countries["Saudi Arabia"]
+        uae_count = countries["UAE"]
+        qa_count = countries["Qatar"]
 
         p3 = tf.add_paragraph()
-        p3.text = f"\n{len(companies)} Companies Identified  |  KSA: {sa_count}  |  UAE: {uae_count}  |  Qatar: {qa_count}  |  {date.today().strftime('%B %d, %Y')}"
+        p3.text = f"\n{stats['total']} Companies Identified  |  KSA: {sa_count}  |  UAE: {uae_count}  |  Qatar: {qa_count}  |  {date.today().strftime('%B %d, %Y')}"
         p3.font.size = Pt(14)
-        p3.font.color.rgb = WHITE
+        p3.font.color.rgb = self._white
 
-    def _add_executive_summary(self, prs, companies):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+    def _add_executive_summary(self, prs, stats):
+        slide = prs.slides.add_slide(self._blank_layout)
         self._add_slide_title(slide, "Executive Summary")
 
-        countries = Counter(c["country"] for c in companies)
-        high_conf = sum(1 for c in companies if c["corroboration_score"] >= 2)
-        s4_count = sum(1 for c in companies if "SAP S/4HANA" in c["sap_products"])
-
         lines = [
-            f"Total unique SAP end-customers identified: {len(companies)}",
-            f"High-confidence (confirmed by 2+ source types): {high_conf}",
-            f"Running SAP S/4HANA: {s4_count}",
+            f"Total unique SAP end-customers identified: {stats['total']}",
+            f"High-confidence (confirmed by 2+ source types): {len(stats['high_conf'])}",
+            f"Running SAP S/4HANA: {stats['s4_count']}",
             "",
             "By Country:",
         ]
-        for country, count in countries.most_common():
+        for country, count in stats["top_countries"]:
             lines.append(f"  {country}: {count} companies")
         lines.append("")
         lines.append("By Industry:")
-        industry_counter = Counter()
-        for c in companies:
-            for ind in c["industries"]:
-                industry_counter[ind] += 1
-        for ind, count in industry_counter.most_common(8):
+        for ind, count in stats["top_industries"][:8]:
             lines.append(f"  {ind}: {count}")
 
         txBox = slide.shapes.add_textbox(Inches(0.8), Inches(1.5), Inches(11.5), Inches(5))
         tf = txBox.text_frame
         tf.word_wrap = True
-        for line in lines:
-            p = tf.add_paragraph()
-            p.text = line
-            p.font.size = Pt(14)
-            p.font.color.rgb = SAP_DARK
+        self._add_lines(tf, lines, Pt(14), self._dark)
 
-    def _add_country_breakdown(self, prs, companies):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+    def _add_country_breakdown(self, prs, stats):
+        slide = prs.slides.add_slide(self._blank_layout)
         self._add_slide_title(slide, "Country Breakdown")
 
-        countries = defaultdict(lambda: {"count": 0, "products": Counter(), "industries": Counter()})
-        for c in companies:
-            cn = c["country"]
-            countries[cn]["count"] += 1
-            for p in c["sap_products"]:
-                countries[cn]["products"][p] += 1
-            for ind in c["industries"]:
-                countries[cn]["industries"][ind] += 1
+        countries = stats["per_country"]
 
         headers = ["Country", "Companies", "Top SAP Product", "Top Industry"]
         rows = len(countries) + 1
         table = slide.shapes.add_table(rows, len(headers), Inches(1), Inches(1.8), Inches(11), Inches(2.5)).table
-
-        for i, header in enumerate(headers):
-            cell = table.cell(0, i)
-            cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = SAP_BLUE
-
-        for i, (cn, data) in enumerate(sorted(countries.items()), 1):
-            top_prod = data["products"].most_common(1)[0][0] if data["products"] else "N/A"
-            top_ind = data["industries"].most_common(1)[0][0] if data["industries"] else "N/A"
-            table.cell(i, 0).text = cn
-            table.cell(i, 1).text = str(data["count"])
-            table.cell(i, 2).text = top_prod
-            table.cell(i, 3).text = top_ind
-
-    def _add_industry_breakdown(self, prs, companies):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        self._set_header(table, headers)
+
+        body = []
+        for cn, data in sorted(countries.items()):
+            # max() picks the first of equal counts, as most_common(1) does
+            top_prod = max(data["products"].items(), key=itemgetter(1))[0] if data["products"] else "N/A"
+            top_ind = max(data["industries"].items(), key=itemgetter(1))[0] if data["industries"] else "N/A"
+            body.append((cn, str(data["count"]), top_prod, top_ind))
+        self._fill_rows(table, body)
+
+    def _add_industry_breakdown(self, prs, stats):
+        slide = prs.slides.add_slide(self._blank_layout)
         self._add_slide_title(slide, "Industry Breakdown")
 
-        industry_counter = Counter()
-        for c in companies:
-            for ind in c["industries"]:
-                industry_counter[ind] += 1
-        if not industry_counter:
+        top_industries = stats["top_industries"]
+        if not top_industries:
             return
 
         headers = ["Industry", "Companies"]
-        rows = min(len(industry_counter), 15) + 1
+        rows = len(top_industries) + 1
         table = slide.shapes.add_table(rows, len(headers), Inches(1), Inches(1.8), Inches(11), Inches(3.5)).table
+        self._set_header(table, headers)
+        self._fill_rows(table, [(ind, str(count)) for ind, count in top_industries])
 
-        for i, header in enumerate(headers):
-            cell = table.cell(0, i)
-            cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = SAP_BLUE
-
-        for i, (ind, count) in enumerate(industry_counter.most_common(15), 1):
-            table.cell(i, 0).text = ind
-            table.cell(i, 1).text = str(count)
-
-    def _add_products(self, prs, companies):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+    def _add_products(self, prs, stats):
+        slide = prs.slides.add_slide(self._blank_layout)
         self._add_slide_title(slide, "SAP Product Landscape")
 
-        product_counter = Counter()
-        for c in companies:
-            for p in c["sap_products"]:
-                product_counter[p] += 1
+        top_products = stats["top_products"]
 
         headers = ["Product", "Companies Using"]
-        rows = min(len(product_counter), 12) + 1
+        rows = len(top_products) + 1
         table = slide.shapes.add_table(rows, len(headers), Inches(1), Inches(1.8), Inches(11), Inches(3.5)).table
+        self._set_header(table, headers)
+        self._fill_rows(table, [(prod, str(count)) for prod, count in top_products])
 
-        for i, header in enumerate(headers):
-            cell = table.cell(0, i)
-            cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = SAP_BLUE
-
-        for i, (prod, count) in enumerate(product_counter.most_common(12), 1):
-            table.cell(i, 0).text = prod
-            table.cell(i, 1).text = str(count)
-
-    def _add_company_table(self, prs, companies, country):
-        filtered = [c for c in companies if c["country"] == country]
+    def _add_company_table(self, prs, filtered, country):
         if not filtered:
             return
 
@@ -1224,7 +1689,7 @@ class ReportGenerator:
             page_companies = filtered[page_idx:page_idx + page_size]
             page_label = f" (page {page_idx // page_size + 1})" if len(filtered) > page_size else ""
 
-            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide = prs.slides.add_slide(self._blank_layout)
             self._add_slide_title(slide, f"SAP Customers — {country}{page_label}")
 
             headers = ["Company", "Industry", "SAP Products", "Evidence / Source", "Conf."]
@@ -1238,20 +1703,10 @@ class ReportGenerator:
             table.columns[3].width = Inches(4.3)
             table.columns[4].width = Inches(1.0)
 
-            for i, header in enumerate(headers):
-                cell = table.cell(0, i)
-                cell.text = header
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = SAP_BLUE
-                for paragraph in cell.text_frame.paragraphs:
-                    paragraph.font.color.rgb = WHITE
-                    paragraph.font.size = Pt(10)
-                    paragraph.font.bold = True
-
-            for i, comp in enumerate(page_companies, 1):
-                table.cell(i, 0).text = comp["company"][:40]
-                table.cell(i, 1).text = ", ".join(comp["industries"])[:25] if comp["industries"] else "—"
-                table.cell(i, 2).text = ", ".join(comp["sap_products"][:3])[:50]
+            self._set_header(table, headers, styled=True)
+
+            body = []
+            for comp in page_companies:
                 # Evidence column: show top evidence summary
                 evidence_parts = []
                 for ev in comp.get("evidence", [])[:2]:
@@ -1261,24 +1716,22 @@ class ReportGenerator:
                         evidence_parts.append(f"[{src}] {summary[:60]}")
                     elif src:
                         evidence_parts.append(src)
-                table.cell(i, 3).text = " | ".join(evidence_parts)[:100] if evidence_parts else ", ".join(comp["sources"][:2])
                 score = comp["corroboration_score"]
                 conf = "High" if score >= 2 else "Med" if score == 1 else "Low"
-                table.cell(i, 4).text = conf
-
-                # Style cells
-                for col in range(len(headers)):
-                    cell = table.cell(i, col)
-                    for paragraph in cell.text_frame.paragraphs:
-                        paragraph.font.size = Pt(8)
-                        paragraph.font.color.rgb = SAP_DARK
+                body.append((
+                    comp["company"][:40],
+                    ", ".join(comp["industries"])[:25] if comp["industries"] else "—",
+                    ", ".join(comp["sap_products"][:3])[:50],
+                    " | ".join(evidence_parts)[:100] if evidence_parts else ", ".join(comp["sources"][:2]),
+                    conf,
+                ))
+            self._fill_rows(table, body, self._cell_pt, self._dark)
 
-    def _add_high_confidence(self, prs, companies):
-        high_conf = [c for c in companies if c["corroboration_score"] >= 2]
+    def _add_high_confidence(self, prs, high_conf):
         if not high_conf:
             return
 
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide = prs.slides.add_slide(self._blank_layout)
         self._add_slide_title(slide, "High-Confidence Targets (2+ Source Types)")
 
         headers = ["Company", "Country", "SAP Products", "Sources", "Key Evidence"]
@@ -1291,34 +1744,24 @@ class ReportGenerator:
         table.columns[3].width = Inches(2.0)
         table.columns[4].width = Inches(4.4)
 
-        for i, header in enumerate(headers):
-            cell = table.cell(0, i)
-            cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = SAP_BLUE
-            for paragraph in cell.text_frame.paragraphs:
-                paragraph.font.color.rgb = WHITE
-                paragraph.font.size = Pt(10)
-                paragraph.font.bold = True
-
-        for i, comp in enumerate(high_conf[:15], 1):
-            table.cell(i, 0).text = comp["company"][:35]
-            table.cell(i, 1).text = comp["country"]
-            table.cell(i, 2).text = ", ".join(comp["sap_products"][:3])[:45]
-            table.cell(i, 3).text = ", ".join(comp["sources"][:3])[:30]
+        self._set_header(table, headers, styled=True)
+
+        body = []
+        for comp in high_conf[:15]:
             # Show best evidence summary
             best_ev = ""
             for ev in comp.get("evidence", []):
                 if ev.get("summary"):
                     best_ev = ev["summary"][:80]
                     break
-            table.cell(i, 4).text = best_ev or "—"
-
-            for col in range(len(headers)):
-                cell = table.cell(i, col)
-                for paragraph in cell.text_frame.paragraphs:
-                    paragraph.font.size = Pt(8)
-                    paragraph.font.color.rgb = SAP_DARK
+            body.append((
+                comp["company"][:35],
+                comp["country"],
+                ", ".join(comp["sap_products"][:3])[:45],
+                ", ".join(comp["sources"][:3])[:30],
+                best_ev or "—",
+            ))
+        self._fill_rows(table, body, self._cell_pt, self._dark)
 
     def _add_evidence_detail(self, prs, companies):
         """Add detailed evidence slides showing references per company.
@@ -1337,7 +1780,7 @@ class ReportGenerator:
             page = companies_with_evidence[page_idx:page_idx + page_size]
             page_num = page_idx // page_size + 1
 
-            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide = prs.slides.add_slide(self._blank_layout)
             self._add_slide_title(slide, f"Evidence & References (page {page_num})")
 
             y_pos = 1.4
@@ -1350,7 +1793,7 @@ class ReportGenerator:
                 p.text = f"{comp['company']} ({comp['country']}) — {', '.join(comp['sap_products'][:3])}"
                 p.font.size = Pt(11)
                 p.font.bold = True
-                p.font.color.rgb = SAP_BLUE
+                p.font.color.rgb = self._blue
 
                 # Evidence bullets
                 y_pos += 0.3
@@ -1373,17 +1816,13 @@ class ReportGenerator:
                 if not evidence_lines:
                     evidence_lines = [", ".join(comp.get("sources", ["—"]))]
 
-                for line in evidence_lines:
-                    ep = ev_tf.add_paragraph()
-                    ep.text = f"  {line}"
-                    ep.font.size = Pt(8)
-                    ep.font.color.rgb = GRAY
-                    ep.space_after = Pt(2)
+                self._add_lines(ev_tf, [f"  {line}" for line in evidence_lines],
+                                self._evidence_pt, self._gray, space_after=self._evidence_gap)
 
                 y_pos += 0.55 + len(evidence_lines) * 0.12
 
-    def _add_methodology(self, prs):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+    def _add_methodology(self, prs, incomplete_sources=None):
+        slide = prs.slides.add_slide(self._blank_layout)
         self._add_slide_title(slide, "Methodology & Sources")
 
         methods = [
@@ -1398,32 +1837,141 @@ class ReportGenerator:
             "Exclusion filter applied: System integrators, tech vendors, and consulting firms are excluded",
             f"Report generated: {date.today().isoformat()}",
         ]
+        if incomplete_sources:
+            methods.append(
+                f"Incomplete: {', '.join(incomplete_sources)} did not finish within "
+                f"{SOURCE_DEADLINE_SECONDS}s; their signals are not included"
+            )
 
         txBox = slide.shapes.add_textbox(Inches(0.8), Inches(1.5), Inches(11.5), Inches(5))
         tf = txBox.text_frame
         tf.word_wrap = True
-        for method in methods:
-            p = tf.add_paragraph()
-            p.text = ("• " + method) if method else ""
-            p.font.size = Pt(12)
-            p.font.color.rgb = SAP_DARK
+        self._add_lines(tf, [("• " + method) if method else "" for method in methods], Pt(12), self._dark)
+
+    def _set_header(self, table, headers: list[str], styled: bool = False):
+        """Fill row 0 with blue header cells; ``styled`` also sets white bold text.
+
+        The fill (and font) is set once through the API on the first cell and
+        its properties copied to the others, as _fill_rows does for bodies."""
+        probe = table.cell(0, 0)
+        probe.fill.solid()
+        probe.fill.fore_color.rgb = self._blue
+        fill = probe._tc.tcPr
+        style = None
+        if styled:
+            paragraph = probe.text_frame.paragraphs[0]
+            paragraph.font.color.rgb = self._white
+            paragraph.font.size = self._header_pt
+            paragraph.font.bold = True
+            style = paragraph._p.pPr
+        for tc, header in zip(table._tbl.tr_lst[0].tc_lst, headers):
+            txBody = tc.get_or_add_txBody()
+            txBody.clear_content()
+            for line in header.split("\n"):
+                p = txBody.add_p()
+                if style is not None:
+                    p.insert(0, copy.deepcopy(style))
+                p.append_text(line)
+            if tc is not probe._tc:
+                tc._remove_tcPr()
+                tc.append(copy.deepcopy(fill))
+
+    @staticmethod
+    def _fill_rows(table, rows: list[tuple[str, ...]], size=None, color=None):
+        """Write body rows (table row 1 onwards), optionally with every
+        paragraph in a given font size/colour.
+
+        Produces the same markup as ``table.cell(i, j).text = ...`` followed
+        by per-paragraph font settings, but writes the cell elements directly
+        and builds the formatting once, copying it into each paragraph."""
+        if not rows:
+            return
+        style = None
+        if size is not None:
+            # Format one paragraph through the API and reuse its properties
+            probe = table.cell(1, 0).text_frame.paragraphs[0]
+            probe.font.size = size
+            probe.font.color.rgb = color
+            style = probe._p.pPr
+        for tr, values in zip(table._tbl.tr_lst[1:], rows):
+            for tc, value in zip(tr.tc_lst, values):
+                txBody = tc.get_or_add_txBody()
+                txBody.clear_content()
+                for line in value.split("\n"):
+                    p = txBody.add_p()
+                    if style is not None:
+                        p.insert(0, copy.deepcopy(style))
+                    p.append_text(line)
+
+    @staticmethod
+    def _add_lines(tf, lines: list[str], size, color, space_after=None):
+        """Append one paragraph per line, all with the same font size/colour.
+
+        Same markup as add_paragraph() plus the text/font setters for each
+        line, but the formatting is applied once to a template paragraph
+        whose copies are filled in and attached in a single step."""
+        template = tf.add_paragraph()
+        template.font.size = size
+        template.font.color.rgb = color
+        if space_after is not None:
+            template.space_after = space_after
+        template = template._p
+        txBody = template.getparent()
+        txBody.remove(template)
+        paragraphs = []
+        for line in lines:
+            p = copy.deepcopy(template)
+            p.append_text(line)
+            paragraphs.append(p)
+        txBody.extend(paragraphs)
 
     def _add_slide_title(self, slide, title: str):
-        txBox = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.9))
+        txBox = slide.shapes.add_textbox(*self._title_box)
         tf = txBox.text_frame
         p = tf.paragraphs[0]
         p.text = title
-        p.font.size = Pt(28)
+        p.font.size = self._title_pt
         p.font.bold = True
-        p.font.color.rgb = SAP_DARK
+        p.font.color.rgb = self._dark
 
 
 # ============================================================================
 # MAIN AGENT ORCHESTRATION
 # ============================================================================
 
-def run_agent(sources: list[str] | None = None, output_dir: str = "output"):
-    """Main orchestration loop."""
+def _build_source(source_class, use_cache: bool):
+    """Instantiate a source, passing the cache setting to live scrapers."""
+    if issubclass(source_class, BaseScraper):
+        return source_class(use_cache=use_cache)
+    return source_class()
+
+
+# CLI source key -> signal source, in default run order
+SOURCES = {
+    "seed": SeedListSource,
+    "sap_stories": SAPCustomerStoriesScraper,
+    "press": PressReleaseScraper,
+    "jobs": JobPostingScraper,
+    "gov": ProcurementScraper,
+    "events": ConferenceScraper,
+}
+
+# Wall-clock budget for all sources together; whatever is still running after
+# this is abandoned and the report is built from the sources that finished
+SOURCE_DEADLINE_SECONDS = 600
+
+
+def run_agent(sources: list[str] | None = None, output_dir: str = "output", use_cache: bool = True,
+              export_signals: bool = False, signals_file: str | None = None,
+              exit_after_deadline: bool = False):
+    """Main orchestration loop. With ``signals_file`` the scraping phase is
+    skipped and the report is rebuilt from a previous signal export.
+
+    Sources still running at SOURCE_DEADLINE_SECONDS are left out of the
+    report and listed in it as incomplete. Their worker threads cannot be
+    stopped and would be joined at interpreter exit, so with
+    ``exit_after_deadline`` the process exits as soon as the report is
+    written instead of waiting for them."""
     print()
     print("=" * 70)
     print("  SAP Customer Intelligence Agent — GCC Edition")
@@ -1432,37 +1980,61 @@ def run_agent(sources: list[str] | None = None, output_dir: str = "output"):
     print("=" * 70)
     print()
 
-    scraper_classes = {
-        "seed": SeedListSource,
-        "sap_stories": SAPCustomerStoriesScraper,
-        "press": PressReleaseScraper,
-        "jobs": JobPostingScraper,
-        "gov": ProcurementScraper,
-        "events": ConferenceScraper,
-    }
-
-    active_sources = sources if sources else list(scraper_classes.keys())
-    print(f"Active sources: {', '.join(active_sources)}")
+    if signals_file:
+        active_sources = []
+        print(f"Loading signals from: {signals_file}")
+    else:
+        active_sources = sources if sources else list(SOURCES)
+        print(f"Active sources: {', '.join(active_sources)}")
     print()
 
-    all_signals: list[SAPSignal] = []
-
-    for key in tqdm(active_sources, desc="Collecting signals", unit="source"):
-        if key not in scraper_classes:
+    runnable = []
+    for key in active_sources:
+        if key not in SOURCES:
             logger.warning("Unknown source: %s", key)
             continue
+        runnable.append(key)
+
+    # Sources are independent and I/O bound, so run them side by side; they
+    # share the pooled session and the per-host throttle
+    results: dict[str, list[SAPSignal]] = {}
+    late: list[str] = []
+    if runnable:
+        pool = ThreadPoolExecutor(max_workers=min(8, len(runnable)))
+        futures = {pool.submit(lambda k=key: _build_source(SOURCES[k], use_cache).scrape()): key
+                   for key in runnable}
+        progress = tqdm(total=len(futures), desc="Collecting signals", unit="source")
         try:
-            print(f"\n  Source: {key}...")
-            scraper = scraper_classes[key]()
-            signals = scraper.scrape()
-            all_signals.extend(signals)
-            print(f"    → {len(signals)} signals collected")
-        except Exception as e:
-            logger.error("Source %s failed: %s", key, e, exc_info=True)
-            print(f"    → Error: {e}")
+            for future in as_completed(futures, timeout=SOURCE_DEADLINE_SECONDS):
+                key = futures[future]
+                progress.update()
+                try:
+                    results[key] = future.result()
+                    tqdm.write(f"  Source: {key} → {len(results[key])} signals collected")
+                except Exception as e:
+                    logger.error("Source %s failed: %s", key, e, exc_info=True)
+                    tqdm.write(f"  Source: {key} → Error: {e}")
+        except FuturesTimeout:
+            late = [key for future, key in futures.items() if not future.done()]
+            logger.warning("Deadline of %ds reached; continuing without: %s",
+                           SOURCE_DEADLINE_SECONDS, ", ".join(late))
+            tqdm.write(f"  Timed out: {', '.join(late)} (report uses the sources that finished)")
+        finally:
+            progress.close()
+            # Don't wait on stragglers here; see exit_after_deadline
+            pool.shutdown(wait=False, cancel_futures=True)
+        # Only useful while sources are fetching; don't carry pages into the report phase
+        BaseScraper.clear_response_memo()
+
+    # Merge in the requested source order so aggregation stays deterministic
+    all_signals: list[SAPSignal] = load_signals_jsonl(signals_file) if signals_file else []
+    for key in runnable:
+        all_signals.extend(results.get(key, []))
 
     raw_count = len(all_signals)
     print(f"\nTotal raw signals: {raw_count}")
+    if export_signals and not signals_file:
+        print(f"Raw signals exported: {export_signals_jsonl(all_signals, output_dir)}")
 
     print("Deduplicating, filtering exclusions, and aggregating...")
     companies = deduplicate_signals(all_signals)
@@ -1470,27 +2042,47 @@ def run_agent(sources: list[str] | None = None, output_dir: str = "output"):
 
     print("\nGenerating PowerPoint report...")
     generator = ReportGenerator(output_dir=output_dir)
-    filepath = generator.generate(companies, raw_count)
+    filepath = generator.generate(companies, raw_count, incomplete_sources=late)
 
     print()
     print("=" * 70)
     print(f"  REPORT READY: {filepath}")
     print(f"  Companies: {len(companies)}")
+    if late:
+        print(f"  Incomplete (timed out after {SOURCE_DEADLINE_SECONDS}s): {', '.join(late)}")
     print("=" * 70)
     print()
 
+    if late and exit_after_deadline:
+        # os._exit skips the interpreter's join of the stuck worker threads
+        logging.shutdown()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
+
     return filepath
 
 
+def _source_list(value: str) -> list[str]:
+    """argparse type for --sources: reject unknown keys before anything runs."""
+    keys = [key.strip() for key in value.split(",") if key.strip()]
+    unknown = [key for key in keys if key not in SOURCES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown source(s): {', '.join(unknown)} (choose from {', '.join(SOURCES)})"
+        )
+    return keys
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="SAP Customer Intelligence Agent — Identifies real SAP customers in GCC"
     )
     parser.add_argument(
         "--sources",
-        type=str,
+        type=_source_list,
         default=None,
-        help="Comma-separated sources: seed,sap_stories,press,jobs,gov,events (default: all)",
+        help=f"Comma-separated sources: {','.join(SOURCES)} (default: all)",
     )
     parser.add_argument(
         "--output",
@@ -1498,10 +2090,36 @@ def main():
         default="output",
         help="Output directory (default: ./output)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTTP cache (only used when requests-cache is installed)",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Empty the on-disk HTTP cache before running, then refill it",
+    )
+    parser.add_argument(
+        "--export-signals",
+        action="store_true",
+        help="Also write the raw signals as JSON Lines to the output directory",
+    )
+    parser.add_argument(
+        "--from-signals",
+        type=str,
+        default=None,
+        metavar="JSONL",
+        help="Skip scraping and rebuild the report from a --export-signals file",
+    )
     args = parser.parse_args()
 
-    sources = args.sources.split(",") if args.sources else None
-    run_agent(sources=sources, output_dir=args.output)
+    sources = args.sources or None
+    if args.clear_cache and not BaseScraper.clear_cache():
+        logger.warning("--clear-cache ignored: requests-cache is not installed")
+    run_agent(sources=sources, output_dir=args.output, use_cache=not args.no_cache,
+              export_signals=args.export_signals, signals_file=args.from_signals,
+              exit_after_deadline=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+"""MAX_BODY_BYTES must hold for cached fetches too: an oversized page is
+neither read into memory in full nor written to the HTTP cache in full."""
+
+import os
+import sys
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sap_agent_standalone as agent  # noqa: E402
+
+pytest.importorskip("requests_cache")
+
+CAP = 256 * 1024
+BODY_BYTES = 8 * 1024 * 1024
+CHUNK = b"<p>" + b"x" * (64 * 1024 - 7) + b"</p>\n"
+
+
+class _BigPage(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        chunked = self.path.startswith("/chunked")
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.send_header("Content-Length", str(BODY_BYTES))
+        self.end_headers()
+        sent = 0
+        try:
+            while sent < BODY_BYTES:
+                if chunked:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(CHUNK), CHUNK))
+                else:
+                    self.wfile.write(CHUNK)
+                sent += len(CHUNK)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client stops reading at the cap
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _BigPage)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.setattr(agent.BaseScraper, "MAX_BODY_BYTES", CAP)
+    monkeypatch.setattr(agent.BaseScraper, "CACHE_NAME", str(tmp_path / "cache"))
+    monkeypatch.setattr(agent.BaseScraper, "_sessions", {})
+    yield agent.BaseScraper(use_cache=True)
+    for session in agent.BaseScraper._sessions.values():
+        session.close()
+
+
+@pytest.mark.parametrize("path", ["/sized", "/chunked"])
+def test_oversized_response_is_capped_in_memory_and_cache(server, scraper, tmp_path, path):
+    url = server + path
+
+    tracemalloc.start()
+    resp = scraper._get(url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(resp.content) == CAP
+    # Allows for first-request setup; a full read of the body peaks at ~4x its size
+    assert peak < BODY_BYTES // 2
+
+    cache = scraper.session.cache
+    key = cache.create_key(agent.requests.Request("GET", url).prepare())
+    cached = cache.get_response(key)
+    assert cached is not None
+    assert len(cached.content) == CAP
+    assert os.path.getsize(tmp_path / "cache.sqlite") < BODY_BYTES // 4
+
+    # A second fetch is served from the capped cache entry
+    again = scraper._get(url)
+    assert getattr(again, "from_cache", False)
+    assert again.content == resp.content